@@ -1,27 +1,106 @@
 import os
 import sys
+import argparse
+import asyncio
+import hashlib
+import json
 import logging
+import logging.handlers
+import time
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Dict, Any
+from functools import cached_property
+from typing import TYPE_CHECKING, Optional, Dict, Any, List
 
 from dotenv import load_dotenv
-from langchain_openai import ChatOpenAI
-from langchain.agents import initialize_agent, Tool
 
 from src.vr_automation import VRAutomation
 
+# LangChain é importado sob demanda: caminhos de falha rápida (ex.: pasta de
+# dados ausente) não pagam o custo de importação
+if TYPE_CHECKING:
+    import httpx
+    from langchain.agents import AgentExecutor
+    from langchain_core.callbacks import AsyncCallbackHandler
+    from langchain_openai import ChatOpenAI
+
+
+SEPARATOR = "=" * 60
+WIDE_SEPARATOR = "=" * 80
+
+
+def _build_llm(model: str, temperature: float, api_key: str,
+               http_async_client: Optional["httpx.AsyncClient"] = None) -> "ChatOpenAI":
+    """Cria o ChatOpenAI ligado ao cliente HTTP da execução atual."""
+    from langchain_openai import ChatOpenAI
+    
+    return ChatOpenAI(
+        model=model,
+        temperature=temperature,
+        api_key=api_key,
+        streaming=True,
+        http_async_client=http_async_client
+    )
+
+
+def _create_prefetch_handler(runner: "VRAutomationRunner") -> "AsyncCallbackHandler":
+    """Cria o handler que antecipa o processo completo durante o streaming do LLM."""
+    from langchain_core.callbacks import AsyncCallbackHandler
+    
+    class ProcessPrefetchHandler(AsyncCallbackHandler):
+        """Inicia o processo completo assim que o LLM começa a emitir a chamada da ferramenta."""
+        
+        TOOL_NAME = "Executar_Processo_Completo"
+        
+        # Não bloqueia o stream: roda junto dos demais handlers e falhas não interrompem o agente
+        run_inline = False
+        raise_error = False
+        
+        async def on_llm_new_token(self, token: str, *, chunk: Any = None, **kwargs: Any) -> None:
+            """Agenda o processo completo ao identificar o nome da ferramenta no stream."""
+            message = getattr(chunk, 'message', None)
+            
+            for tool_call_chunk in getattr(message, 'tool_call_chunks', None) or []:
+                if tool_call_chunk.get('name') == self.TOOL_NAME:
+                    runner.start_complete_process()
+                    return
+                    
+    return ProcessPrefetchHandler()
+
 
 class VRAutomationRunner:
     """Classe principal para execução do sistema de automação VR."""
     
+    LLM_MODEL = "gpt-4o-mini"
+    
+    AGENT_SYSTEM_PROMPT = (
+        "Você é um assistente de automação do processamento mensal de VR. "
+        "Utilize as ferramentas disponíveis para executar as tarefas solicitadas. "
+        "Chame as ferramentas independentes no mesmo turno: o relatório e a validação "
+        "aguardam automaticamente a conclusão do processo completo."
+    )
+    
+    # Intervalo (s) entre consultas ao status de um lote da Batch API
+    BATCH_POLL_INTERVAL = 60
+    
+    # Ferramenta do agente -> chave no dicionário de resultados
+    TASK_RESULT_KEYS = {
+        "Executar_Processo_Completo": "processamento_completo",
+        "Gerar_Relatorio_Resumido": "relatorio_resumido",
+        "Validar_Dados": "validacao",
+    }
+    
     def __init__(self):
         """Inicializa o runner com configurações padrão."""
         self.setup_logging()
         self.load_environment()
         self.setup_paths()
-        self.setup_llm()
-        self.automation = VRAutomation()
+        self.setup_prompts()
+        self.automation = VRAutomation(cache_folder=self.cache_folder / "parquet")
+        self._process_task: Optional[asyncio.Task] = None
+        self._llm_semaphore: Optional[asyncio.Semaphore] = None
+        self._last_run_digest: Optional[str] = None
+        self._last_run_result: Optional[str] = None
         
     def setup_logging(self) -> None:
         """Configura o sistema de logging."""
@@ -29,31 +108,44 @@ class VRAutomationRunner:
             level=logging.INFO,
             format='%(asctime)s - %(levelname)s - %(message)s',
             handlers=[
-                logging.FileHandler('vr_automation.log', encoding='utf-8'),
+                logging.handlers.RotatingFileHandler(
+                    'vr_automation.log',
+                    maxBytes=5_000_000,
+                    backupCount=3,
+                    encoding='utf-8',
+                    delay=True
+                ),
                 logging.StreamHandler(sys.stdout)
             ]
         )
+        
+        # Clientes HTTP registram cada requisição em INFO
+        for noisy_logger in ('openai', 'httpx'):
+            logging.getLogger(noisy_logger).setLevel(logging.WARNING)
+            
         self.logger = logging.getLogger(__name__)
         
     def load_environment(self) -> None:
         """Carrega variáveis de ambiente."""
         load_dotenv()
         
+        # Obrigatória apenas no modo agente (validada ao configurar o LLM)
         self.openai_key = os.getenv("OPENAI_API_KEY")
-        if not self.openai_key:
-            self.logger.error("❌ OPENAI_API_KEY não encontrada no arquivo .env")
-            raise ValueError("Variável OPENAI_API_KEY é obrigatória")
             
         # Configurações do processamento
         self.month_competency = int(os.getenv("MONTH_COMPETENCY", "5"))
         self.year_competency = int(os.getenv("YEAR_COMPETENCY", "2025"))
         
-        self.logger.info(f"✅ Configuração carregada: {self.month_competency:02d}/{self.year_competency}")
+        # Limite de chamadas simultâneas ao LLM (evita erros 429 de rate limit)
+        self.max_concurrency = int(os.getenv("OPENAI_MAX_CONCURRENCY", "5"))
+        
+        self.logger.info("✅ Configuração carregada: %02d/%d", self.month_competency, self.year_competency)
         
     def setup_paths(self) -> None:
         """Configura caminhos de arquivos e diretórios."""
         self.data_folder = Path("data")
         self.output_folder = Path("output")
+        self.cache_folder = Path(".cache") / "vr"
         
         # Cria diretório de saída se não existir
         self.output_folder.mkdir(exist_ok=True)
@@ -63,35 +155,122 @@ class VRAutomationRunner:
         
         # Verifica se pasta de dados existe
         if not self.data_folder.exists():
-            self.logger.error(f"❌ Pasta de dados não encontrada: {self.data_folder}")
+            self.logger.error("❌ Pasta de dados não encontrada: %s", self.data_folder)
             raise FileNotFoundError(f"Diretório {self.data_folder} não existe")
             
-        self.logger.info(f"📂 Dados: {self.data_folder} | Saída: {self.output_file}")
+        self.logger.info("📂 Dados: %s | Saída: %s", self.data_folder, self.output_file)
+        
+    def _require_openai_key(self) -> None:
+        """Garante que a chave da OpenAI foi configurada."""
+        if not self.openai_key:
+            self.logger.error("❌ OPENAI_API_KEY não encontrada no arquivo .env")
+            raise ValueError("Variável OPENAI_API_KEY é obrigatória no modo agente")
+            
+    @cached_property
+    def http_client(self) -> "httpx.AsyncClient":
+        """Cliente HTTP assíncrono do LLM, com pool de conexões keep-alive."""
+        import httpx
+        
+        return httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+            timeout=60
+        )
         
-    def setup_llm(self) -> None:
-        """Configura o modelo de linguagem."""
+    async def aclose(self) -> None:
+        """Fecha o cliente HTTP do LLM; LLM e agente são recriados no próximo uso."""
+        http_client = self.__dict__.pop('http_client', None)
+        
+        if http_client is not None:
+            await http_client.aclose()
+            for name in ('llm', 'agent'):
+                self.__dict__.pop(name, None)
+                
+    @cached_property
+    def llm(self) -> "ChatOpenAI":
+        """Modelo de linguagem, configurado no primeiro uso."""
+        self._require_openai_key()
+            
         try:
-            self.llm = ChatOpenAI(
-                model="gpt-4o-mini", 
-                temperature=0,
-                api_key=self.openai_key
-            )
+            llm = _build_llm(self.LLM_MODEL, 0, self.openai_key, self.http_client)
             self.logger.info("🤖 LLM configurado com sucesso")
+            return llm
         except Exception as e:
-            self.logger.error(f"❌ Erro ao configurar LLM: {e}")
+            self.logger.error("❌ Erro ao configurar LLM: %s", e)
             raise
             
+    def setup_prompts(self) -> None:
+        """Monta uma única vez as descrições das ferramentas e as instruções do agente."""
+        self._tool_descriptions = {
+            "Executar_Processo_Completo": (
+                f"Executa todo o processo de geração do arquivo consolidado de VR para {self.month_competency:02d}/{self.year_competency}. "
+                f"Processa todas as planilhas da pasta {self.data_folder} e gera o arquivo final."
+            ),
+            "Validar_Dados": (
+                "Valida os dados processados para identificar inconsistências, "
+                "valores ausentes ou problemas de formatação nos dados consolidados."
+            ),
+            "Gerar_Relatorio_Resumido": (
+                "Gera um relatório resumido consolidado por sindicato, "
+                "apresentando estatísticas e totais por categoria."
+            ),
+        }
+        
+        # Uma única instrução composta evita três loops completos do agente
+        self._agent_task = (
+            f"Para o período {self.month_competency:02d}/{self.year_competency}, execute: "
+            f"1) Executar_Processo_Completo com as planilhas da pasta {self.data_folder}; "
+            f"2) Gerar_Relatorio_Resumido; "
+            f"3) Validar_Dados. "
+            f"Chame as três ferramentas de uma só vez, em paralelo. "
+            f"Ao final, retorne a saída das três ferramentas."
+        )
+        
+        # Instruções individuais enviadas pela Batch API
+        self._batch_tasks = {
+            "processamento_completo": (
+                f"Execute o processo completo para gerar o arquivo consolidado de VR "
+                f"a partir das planilhas da pasta {self.data_folder} "
+                f"para o período {self.month_competency:02d}/{self.year_competency}"
+            ),
+            "relatorio_resumido": "Gere um relatório resumido consolidado por sindicato com as estatísticas principais",
+            "validacao": "Execute a validação dos dados processados para identificar possíveis inconsistências",
+        }
+        
+    def _files_digest(self) -> str:
+        """Calcula a assinatura da competência e dos arquivos de entrada (nome, mtime e tamanho)."""
+        entries = []
+        for p in self.data_folder.iterdir():
+            if p.is_file():
+                stat = p.stat()
+                entries.append((p.name, stat.st_mtime_ns, stat.st_size))
+        key = (self.month_competency, self.year_competency, sorted(entries))
+        return hashlib.sha256(repr(key).encode('utf-8')).hexdigest()
+        
+    def _run_complete_process_cached(self) -> str:
+        """Executa o processo completo, reaproveitando o resultado da sessão para entradas inalteradas."""
+        digest = self._files_digest()
+        
+        # Cache em memória: mesma sessão, mesmas entradas
+        if digest == self._last_run_digest and self.automation.final_result is not None:
+            return self._last_run_result
+            
+        result = self.automation.run_complete_process(
+            files_folder=self.data_folder,
+            month=self.month_competency,
+            year=self.year_competency,
+            output_file=self.output_file
+        )
+            
+        self._last_run_digest = digest
+        self._last_run_result = result
+        return result
+            
     def execute_complete_process(self, _: str = "") -> str:
         """Executa o processo completo de geração do arquivo consolidado."""
         try:
             self.logger.info("🚀 Iniciando processo completo...")
             
-            result = self.automation.run_complete_process(
-                files_folder=str(self.data_folder),
-                month=self.month_competency,
-                year=self.year_competency,
-                output_file=str(self.output_file)
-            )
+            result = self._run_complete_process_cached()
             
             self.logger.info("✅ Processo completo executado com sucesso")
             return f"✅ Arquivo consolidado gerado: {self.output_file}\n{result}"
@@ -131,125 +310,382 @@ class VRAutomationRunner:
             self.logger.error(error_msg)
             return error_msg
             
-    def create_agent_tools(self) -> list:
-        """Cria as ferramentas para o agente LLM."""
+    def start_complete_process(self) -> asyncio.Task:
+        """Agenda o processo completo em uma thread, uma única vez por execução."""
+        if self._process_task is None:
+            self._process_task = asyncio.ensure_future(
+                asyncio.to_thread(self.execute_complete_process)
+            )
+        return self._process_task
+        
+    async def _ensure_processed(self) -> str:
+        """Aguarda o processo completo, iniciando-o se ainda não foi agendado.
+        
+        Permite que o agente chame as ferramentas em paralelo no mesmo turno:
+        relatório e validação aguardam a mesma execução do processo completo,
+        que pode ter sido antecipada pelo handler de streaming.
+        """
+        return await self.start_complete_process()
+        
+    async def aexecute_complete_process(self, _: str = "") -> str:
+        """Versão assíncrona do processo completo, executada em uma thread."""
+        return await self._ensure_processed()
+        
+    async def avalidate_data(self, _: str = "") -> str:
+        """Versão assíncrona da validação, executada em uma thread."""
+        await self._ensure_processed()
+        return await asyncio.to_thread(self.validate_data, _)
+        
+    async def agenerate_summary_report(self, _: str = "") -> str:
+        """Versão assíncrona do relatório resumido, executada em uma thread."""
+        await self._ensure_processed()
+        return await asyncio.to_thread(self.generate_summary_report, _)
+            
+    @cached_property
+    def agent_tools(self) -> list:
+        """Ferramentas do agente LLM, criadas uma única vez."""
+        from langchain.agents import Tool
+        
         return [
             Tool(
                 name="Executar_Processo_Completo",
                 func=self.execute_complete_process,
-                description=f"Executa todo o processo de geração do arquivo consolidado de VR para {self.month_competency:02d}/{self.year_competency}. "
-                           f"Processa todas as planilhas da pasta {self.data_folder} e gera o arquivo final."
+                coroutine=self.aexecute_complete_process,
+                description=self._tool_descriptions["Executar_Processo_Completo"]
             ),
             Tool(
                 name="Validar_Dados",
                 func=self.validate_data,
-                description="Valida os dados processados para identificar inconsistências, "
-                           "valores ausentes ou problemas de formatação nos dados consolidados."
+                coroutine=self.avalidate_data,
+                description=self._tool_descriptions["Validar_Dados"]
             ),
             Tool(
                 name="Gerar_Relatorio_Resumido",
                 func=self.generate_summary_report,
-                description="Gera um relatório resumido consolidado por sindicato, "
-                           "apresentando estatísticas e totais por categoria."
+                coroutine=self.agenerate_summary_report,
+                description=self._tool_descriptions["Gerar_Relatorio_Resumido"]
             ),
         ]
         
-    def create_agent(self):
-        """Cria o agente de automação."""
-        tools = self.create_agent_tools()
+    @cached_property
+    def agent(self) -> "AgentExecutor":
+        """Agente de automação, criado uma única vez."""
+        from langchain.agents import AgentExecutor, create_openai_tools_agent
+        from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
+        
+        tools = self.agent_tools
         
-        return initialize_agent(
+        prompt = ChatPromptTemplate.from_messages([
+            ("system", self.AGENT_SYSTEM_PROMPT),
+            ("human", "{input}"),
+            MessagesPlaceholder("agent_scratchpad"),
+        ])
+        agent = create_openai_tools_agent(self.llm, tools, prompt)
+        
+        return AgentExecutor(
+            agent=agent,
             tools=tools,
-            llm=self.llm,
-            agent="zero-shot-react-description",
-            verbose=True,
+            verbose=os.getenv("VR_AGENT_VERBOSE") == "1",
             handle_parsing_errors=True,
-            max_iterations=3
+            # Um turno com as chamadas de ferramenta em paralelo + a resposta final
+            max_iterations=2,
+            early_stopping_method="force",
+            return_intermediate_steps=True
         )
         
-    def run_automation_tasks(self) -> Dict[str, Any]:
-        """Executa as tarefas principais de automação."""
+    def run_deterministic(self) -> Dict[str, Any]:
+        """Executa processo, relatório e validação diretamente, sem chamadas ao LLM."""
         results = {}
         
         try:
-            agent = self.create_agent()
-            self.logger.info("🤖 Agente LLM iniciado com sucesso")
+            self.logger.info("🚀 Iniciando processo completo...")
+            results['processamento_completo'] = self._run_complete_process_cached()
+            
+            # Resumo já calculado no processo completo (cache) e validação, em sequência
+            results['relatorio_resumido'] = self.automation.generate_summary_report()
+            results['validacao'] = self.automation.validate_data()
+            
+        except Exception as e:
+            error_msg = f"❌ Erro durante execução das tarefas: {str(e)}"
+            self.logger.error(error_msg)
+            results['error'] = error_msg
+            
+        return results
+        
+    def run_automation_tasks_batch(self) -> Dict[str, Any]:
+        """Envia as tarefas pela Batch API da OpenAI e executa as ferramentas solicitadas.
+        
+        Destinado à execução agendada: o custo por token é menor, mas o lote
+        pode levar até 24h para ser concluído.
+        """
+        results = {}
+        
+        try:
+            from langchain_core.utils.function_calling import convert_to_openai_tool
+            from openai import OpenAI
             
-            # Tarefa 1: Processamento completo
-            self.logger.info("=" * 60)
-            self.logger.info("📋 TAREFA 1: Processamento Completo")
-            self.logger.info("=" * 60)
+            self._require_openai_key()
+            client = OpenAI(api_key=self.openai_key)
             
-            task1 = (f"Execute o processo completo para gerar o arquivo consolidado de VR "
-                    f"a partir das planilhas da pasta {self.data_folder} "
-                    f"para o período {self.month_competency:02d}/{self.year_competency}")
+            # Lote pendente de uma execução anterior é retomado em vez de reenviado
+            batch = self._resume_batch(client)
+            if batch is None:
+                batch = self._submit_batch(client, [convert_to_openai_tool(tool) for tool in self.agent_tools])
+                
+            # Acompanhamento do status até a conclusão do lote
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                time.sleep(self.BATCH_POLL_INTERVAL)
+                batch = client.batches.retrieve(batch.id)
+                self.logger.info("⏳ Lote %s: %s", batch.id, batch.status)
+                
+            if batch.status != "completed":
+                self._batch_state_file.unlink(missing_ok=True)
+                raise RuntimeError(f"Lote {batch.id} finalizado com status {batch.status}")
+                
+            # Etapa 3: ferramentas solicitadas pelo modelo
+            requested_tools = set()
+            output = client.files.content(batch.output_file_id).text
             
-            result1 = agent.invoke({"input": task1})
-            results['processamento_completo'] = result1
-            self.logger.info("✅ Tarefa 1 concluída")
+            for line in output.splitlines():
+                response = json.loads(line)
+                if response.get('error'):
+                    self.logger.warning("⚠️  Requisição %s falhou: %s", response['custom_id'], response['error'])
+                    continue
+                    
+                message = response['response']['body']['choices'][0]['message']
+                for tool_call in message.get('tool_calls') or []:
+                    requested_tools.add(tool_call['function']['name'])
+                    
+            # Etapa 4: execução na ordem do pipeline pelas mesmas funções do agente; o processo
+            # completo sempre roda primeiro, pois relatório e validação dependem da base consolidada
+            requested_tools.add("Executar_Processo_Completo")
+            tool_funcs = {tool.name: tool.func for tool in self.agent_tools}
+            for tool_name, key in self.TASK_RESULT_KEYS.items():
+                if tool_name in requested_tools:
+                    results[key] = tool_funcs[tool_name]()
+                    if tool_name == "Executar_Processo_Completo" and results[key].startswith("❌"):
+                        break
+                        
+            self._batch_state_file.unlink(missing_ok=True)
             
-            # Tarefa 2: Relatório resumido
-            self.logger.info("=" * 60)
-            self.logger.info("📋 TAREFA 2: Relatório Resumido")
-            self.logger.info("=" * 60)
+            failed = self._failed_tasks(results)
+            if failed:
+                results['error'] = f"❌ Tarefas do lote com falha: {', '.join(failed)}"
+            else:
+                self.logger.info("✅ Tarefas do lote concluídas")
             
-            task2 = "Gere um relatório resumido consolidado por sindicato com as estatísticas principais"
+        except Exception as e:
+            error_msg = f"❌ Erro durante execução das tarefas: {str(e)}"
+            self.logger.error(error_msg)
+            results['error'] = error_msg
             
-            result2 = agent.invoke({"input": task2})
-            results['relatorio_resumido'] = result2
-            self.logger.info("✅ Tarefa 2 concluída")
+        return results
+        
+    @staticmethod
+    def _failed_tasks(results: Dict[str, Any]) -> List[str]:
+        """Tarefas cujo resultado é uma mensagem de erro das ferramentas."""
+        return [key for key, value in results.items() if isinstance(value, str) and value.startswith("❌")]
+        
+    @property
+    def _batch_state_file(self) -> Path:
+        """Arquivo com o lote em andamento, para retomada após reinício."""
+        return self.cache_folder / "batch_state.json"
+        
+    def _resume_batch(self, client: Any) -> Optional[Any]:
+        """Retoma o lote enviado por uma execução anterior da mesma competência, se ainda válido."""
+        try:
+            state = json.loads(self._batch_state_file.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
             
-            # Tarefa 3: Validação (opcional)
-            self.logger.info("=" * 60)
-            self.logger.info("📋 TAREFA 3: Validação dos Dados")
-            self.logger.info("=" * 60)
+        if state.get('competence') != f"{self.month_competency:02d}/{self.year_competency}":
+            return None
             
-            task3 = "Execute a validação dos dados processados para identificar possíveis inconsistências"
+        batch = client.batches.retrieve(state['batch_id'])
+        if batch.status in ("failed", "expired", "cancelled"):
+            self.logger.warning("⚠️  Lote anterior %s descartado (status %s)", batch.id, batch.status)
+            self._batch_state_file.unlink(missing_ok=True)
+            return None
             
-            result3 = agent.invoke({"input": task3})
-            results['validacao'] = result3
-            self.logger.info("✅ Tarefa 3 concluída")
+        self.logger.info("🔁 Retomando lote %s (%s)", batch.id, batch.status)
+        return batch
+        
+    def _submit_batch(self, client: Any, tools: List[Dict[str, Any]]) -> Any:
+        """Envia as tarefas à Batch API e registra o lote para retomada."""
+        # Etapa 1: arquivo JSONL com uma requisição de chat por tarefa
+        self.cache_folder.mkdir(parents=True, exist_ok=True)
+        batch_input = self.cache_folder / "batch_input.jsonl"
+        
+        with batch_input.open('w', encoding='utf-8') as f:
+            for custom_id, task in self._batch_tasks.items():
+                request = {
+                    "custom_id": custom_id,
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": self.LLM_MODEL,
+                        "temperature": 0,
+                        "messages": [
+                            {"role": "system", "content": self.AGENT_SYSTEM_PROMPT},
+                            {"role": "user", "content": task},
+                        ],
+                        "tools": tools,
+                    },
+                }
+                f.write(json.dumps(request, ensure_ascii=False) + "\n")
+                
+        # Etapa 2: envio do lote
+        with batch_input.open('rb') as f:
+            input_file = client.files.create(file=f, purpose="batch")
+            
+        batch = client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        self.logger.info("📦 Lote enviado à Batch API: %s", batch.id)
+        
+        self._batch_state_file.write_text(json.dumps({
+            'batch_id': batch.id,
+            'competence': f"{self.month_competency:02d}/{self.year_competency}",
+        }), encoding='utf-8')
+        return batch
+        
+    def run_interactive(self, prompts: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Executa as tarefas através do agente LLM."""
+        return asyncio.run(self.run_automation_tasks_async(prompts))
+        
+    async def _invoke_agent(self, agent: "AgentExecutor", prompt: str) -> Dict[str, Any]:
+        """Envia uma instrução ao agente, respeitando o limite de concorrência."""
+        async with self._llm_semaphore:
+            return await agent.ainvoke(
+                {"input": prompt},
+                config={"callbacks": [_create_prefetch_handler(self)]}
+            )
+        
+    async def run_automation_tasks_async(self, prompts: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Executa as tarefas de automação via agente LLM.
+        
+        Sem instruções avulsas, processo, relatório e validação são pedidos em
+        uma única chamada ao agente; com instruções, cada uma é enviada ao
+        agente de forma concorrente.
+        """
+        results = {}
+        
+        try:
+            agent = self.agent
+            self._llm_semaphore = asyncio.Semaphore(self.max_concurrency)
+            self.logger.info("🤖 Agente LLM iniciado com sucesso")
+            
+            if prompts:
+                outputs = await asyncio.gather(*(self._invoke_agent(agent, prompt) for prompt in prompts))
+                results['respostas_agente'] = {
+                    prompt: output['output'] for prompt, output in zip(prompts, outputs)
+                }
+                return results
+            
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(SEPARATOR)
+                self.logger.info("📋 TAREFAS: Processamento Completo, Relatório Resumido e Validação dos Dados")
+                self.logger.info(SEPARATOR)
+            
+            result = await self._invoke_agent(agent, self._agent_task)
+            
+            # Recupera a saída de cada ferramenta a partir dos passos intermediários
+            tool_outputs = {action.tool: observation for action, observation in result['intermediate_steps']}
+            for tool_name, key in self.TASK_RESULT_KEYS.items():
+                results[key] = tool_outputs.get(tool_name)
+            results['resposta_agente'] = result['output']
+            
+            self.logger.info("✅ Tarefas concluídas")
             
         except Exception as e:
             error_msg = f"❌ Erro durante execução das tarefas: {str(e)}"
             self.logger.error(error_msg)
             results['error'] = error_msg
             
+        finally:
+            # O cliente HTTP e a tarefa do processo pertencem ao event loop desta execução
+            self._process_task = None
+            await self.aclose()
+            
         return results
         
     def print_final_summary(self, results: Dict[str, Any]) -> None:
         """Imprime resumo final da execução."""
-        print("\n" + "=" * 80)
-        print("🎯 RESUMO FINAL DA EXECUÇÃO")
-        print("=" * 80)
+        self.logger.info("🎯 RESUMO FINAL DA EXECUÇÃO")
         
         if 'error' in results:
             print(f"❌ Execução finalizada com erros: {results['error']}")
             return
             
+        failed = self._failed_tasks(results)
+        if failed:
+            print(f"❌ Execução finalizada com erros nas tarefas: {', '.join(failed)}")
+            return
+            
         print(f"📅 Período processado: {self.month_competency:02d}/{self.year_competency}")
         print(f"📂 Dados origem: {self.data_folder}")
         print(f"📄 Arquivo gerado: {self.output_file}")
         print(f"⏰ Processamento concluído em: {datetime.now().strftime('%d/%m/%Y %H:%M:%S')}")
         
-        if self.output_file.exists():
+        try:
             file_size = self.output_file.stat().st_size / 1024  # KB
             print(f"📊 Tamanho do arquivo: {file_size:.1f} KB")
+        except FileNotFoundError:
+            pass
             
         print("\n✅ Processo de automação VR finalizado com sucesso!")
 
 
-def main():
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Interpreta os argumentos de linha de comando."""
+    parser = argparse.ArgumentParser(description="Sistema de Automação VR")
+    parser.set_defaults(command="run", prompt=None)
+    subparsers = parser.add_subparsers(dest="command", metavar="COMANDO")
+    
+    subparsers.add_parser(
+        "run",
+        help="Processa, resume e valida diretamente, sem chamadas ao LLM (padrão)"
+    )
+    
+    agent_parser = subparsers.add_parser(
+        "agent",
+        help="Executa as tarefas através do agente LLM (requer OPENAI_API_KEY)"
+    )
+    agent_parser.add_argument(
+        "--prompt",
+        action="append",
+        metavar="TEXTO",
+        help="Instrução avulsa para o agente; pode ser repetida"
+    )
+    
+    subparsers.add_parser(
+        "batch",
+        help="Envia as tarefas pela Batch API da OpenAI (menor custo, até 24h; requer OPENAI_API_KEY)"
+    )
+    
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None):
     """Função principal de execução."""
+    args = parse_args(argv)
+    
     try:
         print("🚀 Iniciando Sistema de Automação VR")
-        print("=" * 80)
+        print(WIDE_SEPARATOR)
         
         # Inicializa o runner
         runner = VRAutomationRunner()
         
-        # Executa as tarefas
-        results = runner.run_automation_tasks()
+        # Executa as tarefas: processamento direto por padrão, agente sob demanda
+        if args.command == "batch":
+            results = runner.run_automation_tasks_batch()
+        elif args.command == "agent":
+            results = runner.run_interactive(args.prompt)
+        else:
+            results = runner.run_deterministic()
         
         # Imprime resumo final
         runner.print_final_summary(results)
@@ -262,7 +698,7 @@ def main():
         
     except Exception as e:
         print(f"\n❌ Erro crítico na execução: {str(e)}")
-        logging.error(f"Erro crítico: {str(e)}", exc_info=True)
+        logging.error("Erro crítico: %s", e, exc_info=True)
         return 1
 
 
@@ -1,15 +1,40 @@
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
+import hashlib
 import os
 from pathlib import Path
-import warnings
 import logging
-from typing import Dict, List, Optional, Tuple, Any
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Any, Union
 from dataclasses import dataclass
 from enum import Enum
+from pandas.api.types import union_categoricals
+from importlib.util import find_spec
+from concurrent.futures import ThreadPoolExecutor
 
-warnings.filterwarnings('ignore')
+# xlsxwriter é importado sob demanda, apenas na gravação dos relatórios
+if TYPE_CHECKING:
+    import xlsxwriter
+
+
+# Engine de leitura das planilhas: calamine (Rust) quando disponível, openpyxl caso contrário
+EXCEL_ENGINE = "calamine" if find_spec("python_calamine") else "openpyxl"
+
+# Gravação linha a linha, sem manter a planilha inteira em memória
+XLSXWRITER_OPTIONS = {'constant_memory': True, 'strings_to_urls': False}
+
+# Linhas convertidas para objetos Python por vez ao gravar uma aba
+SHEET_CHUNK_ROWS = 5000
+
+# Cache Parquet das bases limpas (opcional); indisponível quando pyarrow não está instalado
+PARQUET_AVAILABLE = find_spec("pyarrow") is not None
+
+
+def _as_datetime(dates: pd.Series) -> pd.Series:
+    """Garante uma coluna datetime64, convertendo textos no formato dia/mês/ano."""
+    if pd.api.types.is_datetime64_any_dtype(dates):
+        return dates
+    return pd.to_datetime(dates, dayfirst=True, errors='coerce', format='mixed')
 
 
 class ValidationLevel(Enum):
@@ -38,22 +63,33 @@ class ProcessingStats:
     professional_discount: float
     excluded_count: int
     processing_time: float
+    unique_unions: int = 0
+    competence: Optional[str] = None
 
 
 class DataLoader:
     """Classe responsável pelo carregamento de dados."""
     
+    # nome -> (arquivo, colunas utilizadas, tipos das colunas)
     FILE_MAPPING = {
-        'admissao': 'ADMISSÃO ABRIL.xlsx',
-        'afastamentos': 'AFASTAMENTOS.xlsx',
-        'aprendiz': 'APRENDIZ.xlsx',
-        'ativos': 'ATIVOS.xlsx',
-        'dias_uteis': 'Base dias uteis.xlsx',
-        'sindicato_valor': 'Base sindicato x valor.xlsx',
-        'desligados': 'DESLIGADOS.xlsx',
-        'estagio': 'ESTÁGIO.xlsx',
-        'exterior': 'EXTERIOR.xlsx',
-        'ferias': 'FÉRIAS.xlsx'
+        'admissao': ('ADMISSÃO ABRIL.xlsx', ['MATRICULA', 'Admissão'], {'MATRICULA': 'string'}),
+        'afastamentos': ('AFASTAMENTOS.xlsx', ['MATRICULA'], {'MATRICULA': 'string'}),
+        'aprendiz': ('APRENDIZ.xlsx', ['MATRICULA'], {'MATRICULA': 'string'}),
+        'ativos': (
+            'ATIVOS.xlsx',
+            ['MATRICULA', 'TITULO DO CARGO', 'DESC. SITUACAO', 'SINDICATO'],
+            {'MATRICULA': 'string', 'SINDICATO': 'string', 'TITULO DO CARGO': 'string'}
+        ),
+        'dias_uteis': ('Base dias uteis.xlsx', ['SINDICATO', 'DIAS UTEIS'], {'SINDICATO': 'string'}),
+        'sindicato_valor': ('Base sindicato x valor.xlsx', ['ESTADO', 'VALOR'], {'ESTADO': 'string'}),
+        'desligados': (
+            'DESLIGADOS.xlsx',
+            ['MATRICULA', 'DATA DEMISSÃO', 'COMUNICADO DE DESLIGAMENTO'],
+            {'MATRICULA': 'string', 'COMUNICADO DE DESLIGAMENTO': 'string'}
+        ),
+        'estagio': ('ESTÁGIO.xlsx', ['MATRICULA'], {'MATRICULA': 'string'}),
+        'exterior': ('EXTERIOR.xlsx', ['MATRICULA'], {'MATRICULA': 'string'}),
+        'ferias': ('FÉRIAS.xlsx', ['MATRICULA', 'DIAS DE FÉRIAS'], {'MATRICULA': 'string', 'DIAS DE FÉRIAS': 'Int32'})
     }
     
     def __init__(self, logger: logging.Logger):
@@ -61,7 +97,7 @@ class DataLoader:
         self.loaded_data = {}
         self.failed_files = []
         
-    def load_all_data(self, files_folder: str) -> Dict[str, pd.DataFrame]:
+    def load_all_data(self, files_folder: Union[str, Path]) -> Dict[str, pd.DataFrame]:
         """Carrega todas as bases de dados necessárias."""
         self.logger.info("📁 Iniciando carregamento das bases de dados...")
         
@@ -70,25 +106,86 @@ class DataLoader:
         if not files_folder.exists():
             raise FileNotFoundError(f"Pasta de dados não encontrada: {files_folder}")
         
-        for name, filename in self.FILE_MAPPING.items():
-            file_path = files_folder / filename
+        # Cada carga registra apenas os próprios arquivos
+        self.loaded_data = {}
+        self.failed_files = []
+        
+        # Leitura das planilhas em paralelo; descompressão e parsing liberam o GIL
+        max_workers = min(len(self.FILE_MAPPING), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                name: executor.submit(self._load_one, files_folder / filename, usecols, dtypes)
+                for name, (filename, usecols, dtypes) in self.FILE_MAPPING.items()
+            }
+        
+        # Resultados registrados na ordem de FILE_MAPPING, após o término de todas as leituras
+        for name, future in futures.items():
+            filename = self.FILE_MAPPING[name][0]
             
             try:
-                if file_path.exists():
-                    df = pd.read_excel(file_path)
-                    self.loaded_data[name] = df
-                    self.logger.info(f"  ✅ {filename}: {len(df)} registros carregados")
-                else:
-                    self.logger.warning(f"  ⚠️  {filename}: arquivo não encontrado")
-                    self.failed_files.append(filename)
+                df = future.result()
+                self.loaded_data[name] = df
+                self.logger.info("  ✅ %s: %s registros carregados", filename, len(df))
+                    
+            except FileNotFoundError:
+                self.logger.warning("  ⚠️  %s: arquivo não encontrado", filename)
+                self.failed_files.append(filename)
                     
             except Exception as e:
-                self.logger.error(f"  ❌ Erro ao carregar {filename}: {str(e)}")
+                self.logger.error("  ❌ Erro ao carregar %s: %s", filename, e)
                 self.failed_files.append(filename)
         
         self._validate_essential_files()
         return self.loaded_data
     
+    def register_cached(self, files_folder: Union[str, Path], data: Dict[str, pd.DataFrame]) -> Dict[str, pd.DataFrame]:
+        """Registra bases vindas do cache com a mesma contabilidade da leitura das planilhas."""
+        files_folder = Path(files_folder)
+        self.loaded_data = {}
+        self.failed_files = []
+        
+        for name, (filename, _, _) in self.FILE_MAPPING.items():
+            if name in data:
+                self.loaded_data[name] = data[name]
+            elif not (files_folder / filename).exists():
+                self.logger.warning("  ⚠️  %s: arquivo não encontrado", filename)
+                self.failed_files.append(filename)
+            else:
+                self.logger.error("  ❌ Erro ao carregar %s: falha registrada na carga que gerou o cache", filename)
+                self.failed_files.append(filename)
+        
+        self._validate_essential_files()
+        return self.loaded_data
+    
+    def _load_one(self, file_path: Path, usecols: List[str], dtypes: Dict[str, str]) -> pd.DataFrame:
+        """Carrega uma única planilha ou levanta a exceção da falha."""
+        if not file_path.exists():
+            raise FileNotFoundError(file_path)
+        return self._read_excel(file_path, usecols, dtypes)
+    
+    def _read_excel(self, file_path: Path, usecols: List[str], dtypes: Dict[str, str]) -> pd.DataFrame:
+        """Lê uma planilha com EXCEL_ENGINE, recorrendo ao openpyxl se o calamine falhar."""
+        if EXCEL_ENGINE == "openpyxl":
+            return self._parse_first_sheet(file_path, "openpyxl", usecols, dtypes)
+        
+        try:
+            return self._parse_first_sheet(file_path, EXCEL_ENGINE, usecols, dtypes)
+        except Exception as e:
+            # calamine é mais rígido com arquivos XLSX malformados
+            self.logger.warning("  ⚠️  %s: falha no engine %s (%s), usando openpyxl", file_path.name, EXCEL_ENGINE, e)
+            return self._parse_first_sheet(file_path, "openpyxl", usecols, dtypes)
+    
+    @staticmethod
+    def _parse_first_sheet(file_path: Path, engine: str, usecols: List[str], dtypes: Dict[str, str]) -> pd.DataFrame:
+        """Abre o arquivo uma única vez com ExcelFile e lê a primeira aba."""
+        with pd.ExcelFile(file_path, engine=engine) as workbook:
+            # Colunas ausentes são ignoradas em vez de invalidar o arquivo inteiro
+            return workbook.parse(
+                workbook.sheet_names[0],
+                usecols=lambda column: column in usecols,
+                dtype=dtypes
+            )
+    
     def _validate_essential_files(self) -> None:
         """Valida se arquivos essenciais foram carregados."""
         essential_files = ['ativos', 'sindicato_valor', 'dias_uteis']
@@ -98,6 +195,103 @@ class DataLoader:
             raise ValueError(f"Arquivos essenciais não encontrados: {missing_essential}")
 
 
+class ProcessedDataCache:
+    """Cache em Parquet das bases já limpas, reaproveitado enquanto as planilhas não mudarem.
+    
+    Opcional: só é usado quando uma pasta de cache é informada e o pyarrow está instalado.
+    """
+    
+    # Incrementar ao alterar a limpeza em DataProcessor: invalida os Parquets já gravados
+    CACHE_VERSION = 1
+    SIGNATURE_FILE = 'signature.txt'
+    
+    def __init__(self, logger: logging.Logger, cache_folder: Optional[Union[str, Path]] = None):
+        self.logger = logger
+        self.cache_folder = Path(cache_folder) if cache_folder is not None else None
+        
+        if self.cache_folder is not None and not PARQUET_AVAILABLE:
+            self.logger.info("ℹ️  pyarrow não instalado: cache Parquet desativado")
+    
+    @property
+    def enabled(self) -> bool:
+        """Indica se o cache está ativo (pasta informada e pyarrow disponível)."""
+        return self.cache_folder is not None and PARQUET_AVAILABLE
+        
+    def _folder_for(self, files_folder: Path) -> Path:
+        """Subpasta do cache específica para cada pasta de dados."""
+        digest = hashlib.sha1(str(files_folder.resolve()).encode('utf-8')).hexdigest()[:12]
+        return self.cache_folder / digest
+    
+    def signature(self, files_folder: Union[str, Path]) -> str:
+        """Assinatura das planilhas (mtime e tamanho), do mapeamento de colunas/tipos e da versão da limpeza."""
+        files_folder = Path(files_folder)
+        entries = []
+        
+        for name, (filename, usecols, dtypes) in DataLoader.FILE_MAPPING.items():
+            source_path = files_folder / filename
+            stat = source_path.stat() if source_path.exists() else None
+            entries.append((
+                name, filename, usecols, sorted(dtypes.items()),
+                (stat.st_mtime_ns, stat.st_size) if stat else None
+            ))
+        
+        key = (self.CACHE_VERSION, entries)
+        return hashlib.sha256(repr(key).encode('utf-8')).hexdigest()
+    
+    def load(self, files_folder: Union[str, Path], signature: str) -> Optional[Dict[str, pd.DataFrame]]:
+        """Retorna as bases limpas do cache, ou None se a assinatura gravada for diferente."""
+        if not self.enabled:
+            return None
+        
+        folder = self._folder_for(Path(files_folder))
+        signature_path = folder / self.SIGNATURE_FILE
+        
+        try:
+            if signature_path.read_text(encoding='utf-8') != signature:
+                return None
+        except OSError:
+            return None
+        
+        try:
+            data = {
+                name: pd.read_parquet(folder / f"{name}.parquet", engine='pyarrow')
+                for name in DataLoader.FILE_MAPPING
+                if (folder / f"{name}.parquet").exists()
+            }
+        except Exception as e:
+            self.logger.warning("  ⚠️  Cache Parquet ignorado: %s", e)
+            return None
+        
+        self.logger.info("⚡ Bases limpas carregadas do cache Parquet (%s arquivos)", len(data))
+        return data
+    
+    def store(self, files_folder: Union[str, Path], signature: str, data: Dict[str, pd.DataFrame]) -> None:
+        """Grava as bases limpas em Parquet, com a assinatura das planilhas de origem."""
+        if not self.enabled:
+            return
+        
+        folder = self._folder_for(Path(files_folder))
+        signature_path = folder / self.SIGNATURE_FILE
+        
+        try:
+            folder.mkdir(parents=True, exist_ok=True)
+            
+            # Assinatura removida primeiro: uma gravação interrompida nunca é reaproveitada
+            signature_path.unlink(missing_ok=True)
+            
+            # Remove bases que não fazem mais parte da carga
+            for stale_path in folder.glob('*.parquet'):
+                if stale_path.stem not in data:
+                    stale_path.unlink()
+            
+            for name, df in data.items():
+                df.to_parquet(folder / f"{name}.parquet", engine='pyarrow', compression='zstd', index=False)
+            
+            signature_path.write_text(signature, encoding='utf-8')
+        except Exception as e:
+            self.logger.warning("  ⚠️  Não foi possível gravar o cache Parquet: %s", e)
+
+
 class DataProcessor:
     """Classe responsável pelo processamento e limpeza de dados."""
     
@@ -113,21 +307,11 @@ class DataProcessor:
         
         for name in matricula_files:
             if name in data and 'MATRICULA' in data[name].columns:
-                data[name]['MATRICULA'] = (
-                    data[name]['MATRICULA']
-                    .astype(str)
-                    .str.strip()
-                    .str.upper()
-                )
+                data[name]['MATRICULA'] = self._normalize_text(data[name]['MATRICULA'])
         
         # Tratar arquivo exterior (coluna diferente)
         if 'exterior' in data and 'MATRICULA' in data['exterior'].columns:
-            data['exterior']['MATRICULA'] = (
-                data['exterior']['MATRICULA']
-                .astype(str)
-                .str.strip()
-                .str.upper()
-            )
+            data['exterior']['MATRICULA'] = self._normalize_text(data['exterior']['MATRICULA'])
         
         # Converter e validar datas
         self._process_dates(data)
@@ -135,9 +319,41 @@ class DataProcessor:
         # Padronizar nomes de sindicatos
         self._standardize_union_names(data)
         
+        # Codificar chaves de junção como categorias
+        self._encode_categoricals(data)
+        
         self.logger.info("  ✅ Dados limpos e padronizados com sucesso")
         return data
     
+    @staticmethod
+    def _normalize_text(values: pd.Series) -> pd.Series:
+        """Aplica strip/upper apenas aos valores distintos da coluna e expande pelos códigos."""
+        codes, uniques = pd.factorize(values)
+        normalized = np.array([str(value).strip().upper() for value in uniques] + [None], dtype=object)
+        # Código -1 (valor ausente) aponta para o None no final
+        return pd.Series(pd.array(normalized[codes], dtype='string'), index=values.index)
+    
+    def _encode_categoricals(self, data: Dict[str, pd.DataFrame]) -> None:
+        """Converte MATRICULA e SINDICATO para CategoricalDtype compartilhado entre as bases."""
+        matricula_columns = [
+            name for name, df in data.items()
+            if 'MATRICULA' in df.columns
+        ]
+        
+        if matricula_columns:
+            # Mesmas categorias em todas as bases para que merge/isin operem sobre os códigos
+            categories = union_categoricals(
+                [pd.Categorical(data[name]['MATRICULA'].dropna()) for name in matricula_columns],
+                sort_categories=True
+            ).categories
+            matricula_dtype = pd.CategoricalDtype(categories)
+            
+            for name in matricula_columns:
+                data[name]['MATRICULA'] = data[name]['MATRICULA'].astype(matricula_dtype)
+        
+        if 'ativos' in data and 'SINDICATO' in data['ativos'].columns:
+            data['ativos']['SINDICATO'] = data['ativos']['SINDICATO'].astype('category')
+    
     def _process_dates(self, data: Dict[str, pd.DataFrame]) -> None:
         """Processa e valida campos de data."""
         date_conversions = [
@@ -169,16 +385,18 @@ class DataProcessor:
                         return pd.to_datetime(date_val, dayfirst=True, errors='raise')
                     
                     except (ValueError, TypeError):
-                        self.logger.warning(f"    ⚠️  Data inválida em {file_key}.{column_name}: '{date_val}'")
+                        self.logger.warning("    ⚠️  Data inválida em %s.%s: '%s'", file_key, column_name, date_val)
                         return pd.NaT
                 
-                # Aplicar conversão
-                data[file_key][column_name] = data[file_key][column_name].apply(safe_date_convert)
+                # Aplicar conversão (células de data já chegam tipadas do leitor)
+                if not pd.api.types.is_datetime64_any_dtype(data[file_key][column_name]):
+                    data[file_key][column_name] = data[file_key][column_name].apply(safe_date_convert)
                 
                 invalid_dates = data[file_key][column_name].isna().sum()
                 if invalid_dates > 0:
                     self.logger.warning(
-                        f"  ⚠️  {file_key}.{column_name}: {invalid_dates}/{original_count} datas inválidas convertidas para NaT"
+                        "  ⚠️  %s.%s: %s/%s datas inválidas convertidas para NaT",
+                        file_key, column_name, invalid_dates, original_count
                     )
     
     def _standardize_union_names(self, data: Dict[str, pd.DataFrame]) -> None:
@@ -187,12 +405,7 @@ class DataProcessor:
         
         for file_key in union_files:
             if file_key in data and 'SINDICATO' in data[file_key].columns:
-                data[file_key]['SINDICATO'] = (
-                    data[file_key]['SINDICATO']
-                    .astype(str)
-                    .str.strip()
-                    .str.upper()
-                )
+                data[file_key]['SINDICATO'] = self._normalize_text(data[file_key]['SINDICATO'])
 
 
 class ExclusionManager:
@@ -202,11 +415,11 @@ class ExclusionManager:
         self.logger = logger
         self.exclusion_details = {}
         
-    def identify_exclusions(self, data: Dict[str, pd.DataFrame]) -> set:
+    def identify_exclusions(self, data: Dict[str, pd.DataFrame]) -> pd.Index:
         """Identifica todas as matrículas a serem excluídas."""
         self.logger.info("🚫 Identificando exclusões por categoria...")
         
-        all_exclusions = set()
+        all_exclusions = pd.Index([], dtype=object)
         
         exclusion_rules = [
             ('directors', self._get_directors),
@@ -219,46 +432,46 @@ class ExclusionManager:
         for category, rule_func in exclusion_rules:
             excluded = rule_func(data)
             self.exclusion_details[category] = excluded
-            all_exclusions.update(excluded)
-            self.logger.info(f"  📊 {category.title()}: {len(excluded)} exclusões")
+            all_exclusions = all_exclusions.union(excluded)
+            self.logger.info("  📊 %s: %s exclusões", category.title(), len(excluded))
         
-        self.logger.info(f"  🎯 Total de exclusões únicas: {len(all_exclusions)}")
+        self.logger.info("  🎯 Total de exclusões únicas: %s", len(all_exclusions))
         return all_exclusions
     
-    def _get_directors(self, data: Dict[str, pd.DataFrame]) -> set:
+    def _get_directors(self, data: Dict[str, pd.DataFrame]) -> pd.Index:
         """Identifica diretores pelo cargo."""
         if 'ativos' not in data:
-            return set()
+            return pd.Index([], dtype=object)
             
-        directors_mask = (
-            data['ativos']['TITULO DO CARGO']
-            .str.contains('DIRETOR', case=False, na=False)
-        )
-        return set(data['ativos'][directors_mask]['MATRICULA'].tolist())
+        # Busca literal uma vez por cargo distinto; posição extra para cargo ausente
+        codes, titles = pd.factorize(data['ativos']['TITULO DO CARGO'])
+        is_director = np.array(['DIRETOR' in str(title).upper() for title in titles] + [False], dtype=bool)
+        directors_mask = is_director[codes]
+        return pd.Index(data['ativos'].loc[directors_mask, 'MATRICULA'].dropna().unique())
     
-    def _get_interns(self, data: Dict[str, pd.DataFrame]) -> set:
+    def _get_interns(self, data: Dict[str, pd.DataFrame]) -> pd.Index:
         """Identifica estagiários."""
         if 'estagio' not in data:
-            return set()
-        return set(data['estagio']['MATRICULA'].tolist())
+            return pd.Index([], dtype=object)
+        return pd.Index(data['estagio']['MATRICULA'].dropna().unique())
     
-    def _get_apprentices(self, data: Dict[str, pd.DataFrame]) -> set:
+    def _get_apprentices(self, data: Dict[str, pd.DataFrame]) -> pd.Index:
         """Identifica aprendizes."""
         if 'aprendiz' not in data:
-            return set()
-        return set(data['aprendiz']['MATRICULA'].tolist())
+            return pd.Index([], dtype=object)
+        return pd.Index(data['aprendiz']['MATRICULA'].dropna().unique())
     
-    def _get_away(self, data: Dict[str, pd.DataFrame]) -> set:
+    def _get_away(self, data: Dict[str, pd.DataFrame]) -> pd.Index:
         """Identifica afastados."""
         if 'afastamentos' not in data:
-            return set()
-        return set(data['afastamentos']['MATRICULA'].tolist())
+            return pd.Index([], dtype=object)
+        return pd.Index(data['afastamentos']['MATRICULA'].dropna().unique())
     
-    def _get_exterior(self, data: Dict[str, pd.DataFrame]) -> set:
+    def _get_exterior(self, data: Dict[str, pd.DataFrame]) -> pd.Index:
         """Identifica colaboradores no exterior."""
         if 'exterior' not in data:
-            return set()
-        return set(data['exterior']['MATRICULA'].tolist())
+            return pd.Index([], dtype=object)
+        return pd.Index(data['exterior']['MATRICULA'].dropna().unique())
 
 
 class CalculationEngine:
@@ -268,11 +481,13 @@ class CalculationEngine:
         self.logger = logger
         self.business_days_mapping = {}
         self.daily_values_mapping = {}
+        self.union_values_mapping = {}
         
     def prepare_calculation_data(self, data: Dict[str, pd.DataFrame]) -> None:
         """Prepara dados para cálculos."""
         self._build_business_days_mapping(data)
         self._build_daily_values_mapping(data)
+        self._build_union_values_mapping(data)
     
     def _build_business_days_mapping(self, data: Dict[str, pd.DataFrame]) -> None:
         """Constrói mapeamento de dias úteis por sindicato."""
@@ -280,12 +495,11 @@ class CalculationEngine:
             self.logger.warning("  ⚠️  Base de dias úteis não encontrada, usando padrão de 22 dias")
             return
             
-        for _, row in data['dias_uteis'].iterrows():
-            union = str(row['SINDICATO']).strip().upper()
-            days = int(row['DIAS UTEIS']) if pd.notna(row['DIAS UTEIS']) else 22
-            self.business_days_mapping[union] = days
+        unions = data['dias_uteis']['SINDICATO'].astype(str).str.strip().str.upper()
+        days = pd.to_numeric(data['dias_uteis']['DIAS UTEIS'], errors='coerce').fillna(22).astype(int)
+        self.business_days_mapping.update(zip(unions.tolist(), days.tolist()))
             
-        self.logger.info(f"  📊 Mapeamento de dias úteis: {len(self.business_days_mapping)} sindicatos")
+        self.logger.info("  📊 Mapeamento de dias úteis: %s sindicatos", len(self.business_days_mapping))
     
     def _build_daily_values_mapping(self, data: Dict[str, pd.DataFrame]) -> None:
         """Constrói mapeamento de valores diários por estado."""
@@ -293,17 +507,37 @@ class CalculationEngine:
             self.logger.warning("  ⚠️  Base de valores não encontrada, usando padrão R$ 35,00")
             return
             
-        for _, row in data['sindicato_valor'].iterrows():
-            state = str(row['ESTADO']).strip().upper()
-            value_str = str(row['VALOR']).replace('R$', '').replace(' ', '').replace(',', '.')
-            
-            try:
-                value = float(value_str)
-                self.daily_values_mapping[state] = value
-            except ValueError:
-                self.logger.warning(f"  ⚠️  Valor inválido para estado {state}: {row['VALOR']}")
+        states = data['sindicato_valor']['ESTADO'].astype(str).str.strip().str.upper()
+        values = pd.to_numeric(
+            data['sindicato_valor']['VALOR']
+            .astype(str)
+            .str.replace('R$', '', regex=False)
+            .str.replace(' ', '', regex=False)
+            .str.replace(',', '.', regex=False),
+            errors='coerce'
+        )
+        
+        invalid = values.isna()
+        
+        # Linhas sem valor (ex.: linhas em branco da planilha) são descartadas sem aviso
+        malformed = invalid & data['sindicato_valor']['VALOR'].notna()
+        if malformed.any():
+            self.logger.warning(
+                "  ⚠️  Valores inválidos para estados: %s", ', '.join(states[malformed].astype(str).tolist())
+            )
+        
+        self.daily_values_mapping.update(zip(states[~invalid].tolist(), values[~invalid].tolist()))
                 
-        self.logger.info(f"  📊 Mapeamento de valores: {len(self.daily_values_mapping)} estados")
+        self.logger.info("  📊 Mapeamento de valores: %s estados", len(self.daily_values_mapping))
+    
+    def _build_union_values_mapping(self, data: Dict[str, pd.DataFrame]) -> None:
+        """Pré-calcula o valor diário de cada sindicato presente na base de ativos."""
+        self.union_values_mapping = {}
+        if 'ativos' not in data or 'SINDICATO' not in data['ativos'].columns:
+            return
+        
+        for union in data['ativos']['SINDICATO'].dropna().unique():
+            self.union_values_mapping[union] = self._find_daily_value(union)
     
     def calculate_days_worked(self, 
                             base_days: int,
@@ -354,8 +588,56 @@ class CalculationEngine:
         
         return max(0, days_worked)
     
+    def calculate_days_worked_batch(self,
+                                    base_days: pd.Series,
+                                    vacation_days: pd.Series,
+                                    admission_dates: pd.Series,
+                                    dismissal_dates: pd.Series,
+                                    competence_month: int,
+                                    competence_year: int) -> pd.Series:
+        """Versão vetorizada de calculate_days_worked para colunas inteiras."""
+        admission_dates = _as_datetime(admission_dates)
+        dismissal_dates = _as_datetime(dismissal_dates)
+        
+        # Em float durante os ajustes; convertido para inteiro ao final
+        days_worked = (base_days - vacation_days).astype(float)
+        
+        # Mês de competência comparado em uma única passada por coluna
+        competence_period = pd.Period(year=competence_year, month=competence_month, freq='M')
+        
+        # Ajuste para admissão no meio do mês
+        admitted = admission_dates.dt.to_period('M') == competence_period
+        remaining_days = 30 - admission_dates.dt.day + 1
+        days_worked = days_worked.where(~admitted, np.trunc(base_days * (remaining_days / 30)))
+        
+        # Ajuste para demissão proporcional
+        dismissed = dismissal_dates.dt.to_period('M') == competence_period
+        days_worked = days_worked.where(~dismissed, np.trunc(base_days * (dismissal_dates.dt.day / 30)))
+        
+        return days_worked.clip(lower=0).astype(int)
+    
+    def get_union_parameters(self, unions: pd.Series) -> Tuple[pd.Series, pd.Series]:
+        """Resolve dias úteis e valor diário uma vez por sindicato distinto e expande para as linhas."""
+        codes, uniques = pd.factorize(unions)
+        
+        # Posição extra no final para sindicato ausente (código -1)
+        base_days = np.array([self.business_days_mapping.get(union, 22) for union in uniques] + [22], dtype=int)
+        daily_values = np.array([self.get_daily_value(union) for union in uniques] + [35.0], dtype=float)
+        
+        return (
+            pd.Series(base_days[codes], index=unions.index),
+            pd.Series(daily_values[codes], index=unions.index)
+        )
+    
     def get_daily_value(self, union_name: str) -> float:
         """Obtém valor diário baseado no sindicato/estado."""
+        value = self.union_values_mapping.get(union_name)
+        if value is None:
+            value = self.union_values_mapping[union_name] = self._find_daily_value(union_name)
+        return value
+    
+    def _find_daily_value(self, union_name: str) -> float:
+        """Procura o primeiro estado contido no nome do sindicato."""
         union_upper = union_name.upper()
         
         for state, value in self.daily_values_mapping.items():
@@ -377,30 +659,39 @@ class DataValidator:
         
         validations = []
         
+        # Colunas numéricas extraídas uma única vez; todas as máscaras em um só bloco
+        days = df['Dias'].to_numpy()
+        total = df['TOTAL'].to_numpy()
+        company = df['Custo empresa'].to_numpy()
+        professional = df['Desconto profissional'].to_numpy()
+        
+        negative_count = int(np.count_nonzero(days < 0))
+        inconsistent_count = int(np.count_nonzero((days > 0) & (total <= 0)))
+        incorrect_split_count = int(np.count_nonzero(np.abs(company + professional - total) > 0.01))
+        extreme_count = int(np.count_nonzero((total > 3000) | (days > 30)))
+        
         # Validação 1: Dias negativos
-        validations.append(self._validate_negative_days(df))
+        validations.append(self._validate_negative_days(negative_count))
         
         # Validação 2: Valores inconsistentes
-        validations.append(self._validate_value_consistency(df))
+        validations.append(self._validate_value_consistency(inconsistent_count))
         
         # Validação 3: Rateio empresa/profissional
-        validations.append(self._validate_cost_split(df))
+        validations.append(self._validate_cost_split(incorrect_split_count))
         
         # Validação 4: Matrículas duplicadas
         validations.append(self._validate_duplicate_registrations(df))
         
         # Validação 5: Valores extremos
-        validations.append(self._validate_extreme_values(df))
+        validations.append(self._validate_extreme_values(extreme_count))
         
         # Validação 6: Dados obrigatórios
         validations.append(self._validate_required_fields(df))
         
         return validations
     
-    def _validate_negative_days(self, df: pd.DataFrame) -> ValidationResult:
+    def _validate_negative_days(self, negative_count: int) -> ValidationResult:
         """Valida se há dias negativos."""
-        negative_count = len(df[df['Dias'] < 0])
-        
         if negative_count > 0:
             return ValidationResult(
                 level=ValidationLevel.ERROR,
@@ -415,13 +706,8 @@ class DataValidator:
             count=0
         )
     
-    def _validate_value_consistency(self, df: pd.DataFrame) -> ValidationResult:
+    def _validate_value_consistency(self, count: int) -> ValidationResult:
         """Valida consistência entre dias e valores."""
-        inconsistent = df[
-            (df['Dias'] > 0) & (df['TOTAL'] <= 0)
-        ]
-        count = len(inconsistent)
-        
         if count > 0:
             return ValidationResult(
                 level=ValidationLevel.ERROR,
@@ -436,14 +722,8 @@ class DataValidator:
             count=0
         )
     
-    def _validate_cost_split(self, df: pd.DataFrame) -> ValidationResult:
-        """Valida se o rateio empresa/profissional está correto."""
-        tolerance = 0.01
-        incorrect_split = df[
-            abs(df['Custo empresa'] + df['Desconto profissional'] - df['TOTAL']) > tolerance
-        ]
-        count = len(incorrect_split)
-        
+    def _validate_cost_split(self, count: int) -> ValidationResult:
+        """Valida se o rateio empresa/profissional está correto (tolerância de R$ 0,01)."""
         if count > 0:
             return ValidationResult(
                 level=ValidationLevel.ERROR,
@@ -478,14 +758,8 @@ class DataValidator:
             count=0
         )
     
-    def _validate_extreme_values(self, df: pd.DataFrame) -> ValidationResult:
-        """Valida valores extremos (muito altos ou baixos)."""
-        # Considera valores extremos: > R$ 3000 ou dias > 30
-        extreme_values = df[
-            (df['TOTAL'] > 3000) | (df['Dias'] > 30)
-        ]
-        count = len(extreme_values)
-        
+    def _validate_extreme_values(self, count: int) -> ValidationResult:
+        """Valida valores extremos (> R$ 3000 ou dias > 30)."""
         if count > 0:
             return ValidationResult(
                 level=ValidationLevel.WARNING,
@@ -527,19 +801,27 @@ class DataValidator:
 class VRAutomation:
     """Classe principal do sistema de automação VR."""
     
-    def __init__(self):
+    def __init__(self, cache_folder: Optional[Union[str, Path]] = None):
         self.logger = self._setup_logger()
         self.data_loader = DataLoader(self.logger)
         self.data_processor = DataProcessor(self.logger)
         self.exclusion_manager = ExclusionManager(self.logger)
         self.calculation_engine = CalculationEngine(self.logger)
         self.validator = DataValidator(self.logger)
+        # Cache Parquet das bases limpas: desativado sem cache_folder (ou sem pyarrow)
+        self.data_cache = ProcessedDataCache(self.logger, cache_folder)
         
+        self.files_folder = None
         self.raw_data = {}
         self.processed_data = {}
+        self._cached_data = None
+        self._cache_signature: Optional[str] = None
         self.final_result = None
         self.processing_stats = None
         
+        # (final_result de origem, resumo) para reaproveitar o resumo por sindicato
+        self._summary_cache: Optional[Tuple[pd.DataFrame, pd.DataFrame]] = None
+        
     def _setup_logger(self) -> logging.Logger:
         """Configura logger específico para VR Automation."""
         logger = logging.getLogger('VRAutomation')
@@ -555,8 +837,18 @@ class VRAutomation:
             
         return logger
     
-    def load_data(self, files_folder: str) -> Dict[str, pd.DataFrame]:
+    def load_data(self, files_folder: Union[str, Path]) -> Dict[str, pd.DataFrame]:
         """Carrega todas as bases de dados."""
+        self.files_folder = files_folder
+        
+        # Bases já limpas em cache dispensam a leitura das planilhas
+        # Assinatura calculada antes da leitura: uma planilha alterada durante a carga invalida o cache
+        self._cache_signature = self.data_cache.signature(files_folder) if self.data_cache.enabled else None
+        self._cached_data = self.data_cache.load(files_folder, self._cache_signature)
+        if self._cached_data is not None:
+            self.raw_data = self.data_loader.register_cached(files_folder, self._cached_data)
+            return self.raw_data
+        
         self.raw_data = self.data_loader.load_all_data(files_folder)
         return self.raw_data
     
@@ -564,15 +856,24 @@ class VRAutomation:
         """Processa e limpa os dados carregados."""
         if not self.raw_data:
             raise ValueError("Dados não carregados. Execute load_data() primeiro.")
+        
+        self._summary_cache = None
+        
+        if self._cached_data is not None:
+            self.processed_data = self._cached_data
+            return self.processed_data
             
         self.processed_data = self.data_processor.clean_and_standardize(self.raw_data)
+        self.data_cache.store(self.files_folder, self._cache_signature, self.processed_data)
         return self.processed_data
     
     def create_consolidated_base(self, competence_month: int = 5, competence_year: int = 2025) -> pd.DataFrame:
         """Cria a base consolidada final com todos os cálculos."""
         start_time = datetime.now()
         
-        self.logger.info(f"🔄 Criando base consolidada para {competence_month:02d}/{competence_year}...")
+        self.logger.info("🔄 Criando base consolidada para %02d/%s...", competence_month, competence_year)
+        
+        self._summary_cache = None
         
         if not self.processed_data:
             raise ValueError("Dados não processados. Execute process_data() primeiro.")
@@ -584,43 +885,45 @@ class VRAutomation:
         if 'ativos' not in self.processed_data:
             raise ValueError("Base de colaboradores ativos não encontrada!")
         
-        base_final = self.processed_data['ativos'][
-            ['MATRICULA', 'TITULO DO CARGO', 'DESC. SITUACAO', 'SINDICATO']
-        ].copy()
-        
-        # Adicionar informações complementares
-        base_final = self._enrich_base_data(base_final)
+        # Seleção de colunas já gera um novo DataFrame; o merge seguinte materializa outro
+        base_final = self.processed_data['ativos'].loc[
+            :, ['MATRICULA', 'TITULO DO CARGO', 'DESC. SITUACAO', 'SINDICATO']
+        ]
         
-        # Aplicar exclusões
+        # Aplicar exclusões antes dos merges: excluídos não são enriquecidos
         exclusions = self.exclusion_manager.identify_exclusions(self.processed_data)
         initial_count = len(base_final)
         base_final = base_final[~base_final['MATRICULA'].isin(exclusions)]
         excluded_count = initial_count - len(base_final)
         
-        self.logger.info(f"  📊 Após exclusões: {len(base_final)} colaboradores elegíveis")
+        self.logger.info("  📊 Após exclusões: %s colaboradores elegíveis", len(base_final))
+        
+        # Adicionar informações complementares
+        base_final = self._enrich_base_data(base_final)
         
         # Aplicar regras de elegibilidade
         base_final = self._apply_eligibility_rules(base_final)
         
         # Gerar registros finais com cálculos
-        results = self._generate_final_records(base_final, competence_month, competence_year)
-        
-        self.final_result = pd.DataFrame(results)
+        self.final_result = self._generate_final_records(base_final, competence_month, competence_year)
         
         # Calcular estatísticas
         processing_time = (datetime.now() - start_time).total_seconds()
+        totals = self.final_result[['Dias', 'TOTAL', 'Custo empresa', 'Desconto profissional']].sum()
         self.processing_stats = ProcessingStats(
             total_collaborators=len(self.final_result),
-            total_days=self.final_result['Dias'].sum(),
-            total_value=self.final_result['TOTAL'].sum(),
-            company_cost=self.final_result['Custo empresa'].sum(),
-            professional_discount=self.final_result['Desconto profissional'].sum(),
+            total_days=int(totals['Dias']),
+            total_value=totals['TOTAL'],
+            company_cost=totals['Custo empresa'],
+            professional_discount=totals['Desconto profissional'],
             excluded_count=excluded_count,
-            processing_time=processing_time
+            processing_time=processing_time,
+            unique_unions=self.final_result['Sindicato do Colaborador'].nunique(),
+            competence=self.final_result['Competência'].iat[0] if len(self.final_result) > 0 else None
         )
         
-        self.logger.info(f"  ✅ Base consolidada criada: {len(self.final_result)} registros")
-        self.logger.info(f"  ⏱️  Tempo de processamento: {processing_time:.2f}s")
+        self.logger.info("  ✅ Base consolidada criada: %s registros", len(self.final_result))
+        self.logger.info("  ⏱️  Tempo de processamento: %.2fs", processing_time)
         
         return self.final_result
     
@@ -628,170 +931,164 @@ class VRAutomation:
         """Enriquece dados base com informações complementares."""
         # Adicionar admissões
         if 'admissao' in self.processed_data:
-            admissions = self.processed_data['admissao'][['MATRICULA', 'Admissão']].copy()
+            admissions = self.processed_data['admissao'][['MATRICULA', 'Admissão']]
             base_df = base_df.merge(admissions, on='MATRICULA', how='left')
         
         # Adicionar férias
-        base_df['Dias_Ferias'] = 0
         if 'ferias' in self.processed_data:
-            holidays_dict = dict(zip(
-                self.processed_data['ferias']['MATRICULA'], 
-                self.processed_data['ferias']['DIAS DE FÉRIAS'].fillna(0)
-            ))
-            base_df['Dias_Ferias'] = base_df['MATRICULA'].map(holidays_dict).fillna(0)
+            # Join pelo índice; em matrícula repetida vale o último registro
+            vacations = (
+                self.processed_data['ferias'][['MATRICULA', 'DIAS DE FÉRIAS']]
+                .drop_duplicates('MATRICULA', keep='last')
+                .set_index('MATRICULA')['DIAS DE FÉRIAS']
+                .rename('Dias_Ferias')
+            )
+            base_df = base_df.join(vacations, on='MATRICULA')
+            base_df['Dias_Ferias'] = base_df['Dias_Ferias'].fillna(0)
+        else:
+            base_df['Dias_Ferias'] = 0
         
         # Adicionar informações de desligamento
-        base_df['Data_Demissao'] = None
-        base_df['Comunicado_Desligamento'] = None
-        
         if 'desligados' in self.processed_data:
-            disconnected_info = self.processed_data['desligados'].set_index('MATRICULA')
-            
-            for idx, row in base_df.iterrows():
-                matricula = row['MATRICULA']
-                if matricula in disconnected_info.index:
-                    base_df.at[idx, 'Data_Demissao'] = disconnected_info.loc[matricula, 'DATA DEMISSÃO']
-                    base_df.at[idx, 'Comunicado_Desligamento'] = disconnected_info.loc[matricula, 'COMUNICADO DE DESLIGAMENTO']
+            dismissals = (
+                self.processed_data['desligados'][['MATRICULA', 'DATA DEMISSÃO', 'COMUNICADO DE DESLIGAMENTO']]
+                .drop_duplicates('MATRICULA')
+                .rename(columns={
+                    'DATA DEMISSÃO': 'Data_Demissao',
+                    'COMUNICADO DE DESLIGAMENTO': 'Comunicado_Desligamento'
+                })
+            )
+            base_df = base_df.merge(dismissals, on='MATRICULA', how='left')
+        else:
+            # Colunas tipadas mesmo sem a base de desligados
+            base_df['Data_Demissao'] = pd.Series(pd.NaT, index=base_df.index, dtype='datetime64[ns]')
+            base_df['Comunicado_Desligamento'] = pd.Series(pd.NA, index=base_df.index, dtype='string')
         
         return base_df
     
     def _apply_eligibility_rules(self, base_df: pd.DataFrame) -> pd.DataFrame:
         """Aplica regras de elegibilidade para pagamento."""
-        base_df['Elegivel_Pagamento'] = True
+        eligible = np.ones(len(base_df), dtype=bool)
         
         # Regra de desligamento: se desligado até dia 15 com comunicado OK, não paga
-        ineligible_count = 0
-        
         if 'Data_Demissao' in base_df.columns and 'Comunicado_Desligamento' in base_df.columns:
-            # Verificar se há dados de demissão válidos
-            valid_dismissals = base_df[
-                (base_df['Comunicado_Desligamento'] == 'OK') &
-                (pd.notna(base_df['Data_Demissao']))
-            ].copy()
+            # Apenas as linhas com data de demissão são avaliadas
+            has_dismissal = base_df['Data_Demissao'].notna().to_numpy()
             
-            if len(valid_dismissals) > 0:
-                # Converter para datetime se não estiver convertido
-                for idx in valid_dismissals.index:
-                    dismissal_date = base_df.loc[idx, 'Data_Demissao']
-                    
-                    # Se for string, tentar converter
-                    if isinstance(dismissal_date, str):
-                        try:
-                            dismissal_date = pd.to_datetime(dismissal_date, dayfirst=True)
-                            base_df.loc[idx, 'Data_Demissao'] = dismissal_date
-                        except:
-                            self.logger.warning(f"  ⚠️  Data de demissão inválida para matrícula {base_df.loc[idx, 'MATRICULA']}: {dismissal_date}")
-                            continue
-                    
-                    # Aplicar regra apenas se a data for válida e for um datetime
-                    if pd.notna(dismissal_date) and hasattr(dismissal_date, 'day'):
-                        if dismissal_date.day <= 15:
-                            base_df.loc[idx, 'Elegivel_Pagamento'] = False
-                            ineligible_count += 1
+            if has_dismissal.any():
+                dismissals = base_df.loc[has_dismissal, ['MATRICULA', 'Data_Demissao', 'Comunicado_Desligamento']]
+                communicated = (dismissals['Comunicado_Desligamento'] == 'OK').fillna(False).to_numpy(dtype=bool)
+                dismissal_dates = _as_datetime(dismissals['Data_Demissao'])
+                
+                # Datas em texto que não puderam ser convertidas
+                unparsed = dismissal_dates.isna().to_numpy() & communicated
+                for matricula, dismissal_date in zip(dismissals['MATRICULA'][unparsed], dismissals['Data_Demissao'][unparsed]):
+                    self.logger.warning("  ⚠️  Data de demissão inválida para matrícula %s: %s", matricula, dismissal_date)
+                
+                eligible[has_dismissal] = ~(communicated & (dismissal_dates.dt.day <= 15).to_numpy())
         
+        ineligible_count = int(np.count_nonzero(~eligible))
         if ineligible_count > 0:
-            self.logger.info(f"  📊 Colaboradores inelegíveis por regra de desligamento: {ineligible_count}")
+            self.logger.info("  📊 Colaboradores inelegíveis por regra de desligamento: %s", ineligible_count)
         
-        return base_df[base_df['Elegivel_Pagamento'] == True]
+        # Filtra direto pela máscara, sem materializar coluna de elegibilidade
+        return base_df[eligible]
     
-    def _generate_final_records(self, base_df: pd.DataFrame, competence_month: int, competence_year: int) -> List[Dict]:
+    def _generate_final_records(self, base_df: pd.DataFrame, competence_month: int, competence_year: int) -> pd.DataFrame:
         """Gera registros finais com todos os cálculos."""
-        results = []
-        
-        for _, employee in base_df.iterrows():
-            # Dados básicos
-            registration = employee['MATRICULA']
-            union = employee['SINDICATO']
-            admission_date = employee.get('Admissão')
-            vacation_days = int(employee['Dias_Ferias'])
-            dismissal_date = employee.get('Data_Demissao')
-            
-            # Obter dias úteis para o sindicato
-            base_days = self.calculation_engine.business_days_mapping.get(union, 22)
-            
-            # Calcular dias trabalhados
-            days_worked = self.calculation_engine.calculate_days_worked(
-                base_days=base_days,
-                vacation_days=vacation_days,
-                admission_date=admission_date,
-                dismissal_date=dismissal_date,
-                competence_month=competence_month,
-                competence_year=competence_year
-            )
-            
-            # Obter valor diário
-            daily_value = self.calculation_engine.get_daily_value(union)
-            
-            # Calcular valores finais
-            total_value = days_worked * daily_value
-            company_cost = total_value * 0.8
-            professional_discount = total_value * 0.2
-            
-            # Criar registro
-            result = {
-                'Matricula': registration,
-                'Admissão': self._format_date_for_output(admission_date),
-                'Sindicato do Colaborador': union,
-                'Competência': f'01/{competence_month:02d}/{competence_year}',
-                'Dias': days_worked,
-                'VALOR DIÁRIO VR': daily_value,
-                'TOTAL': round(total_value, 2),
-                'Custo empresa': round(company_cost, 2),
-                'Desconto profissional': round(professional_discount, 2),
-                'OBS GERAL': self._generate_observations(employee, vacation_days, admission_date, dismissal_date)
-            }
-            
-            results.append(result)
+        # Dados básicos
+        unions = base_df['SINDICATO']
+        admission_dates = base_df['Admissão'] if 'Admissão' in base_df.columns else pd.Series(None, index=base_df.index)
+        dismissal_dates = base_df['Data_Demissao']
+        vacation_days = base_df['Dias_Ferias'].astype(int)
+        
+        # Obter dias úteis e valor diário por sindicato
+        base_days, daily_values = self.calculation_engine.get_union_parameters(unions)
+        
+        # Calcular dias trabalhados
+        days_worked = self.calculation_engine.calculate_days_worked_batch(
+            base_days=base_days,
+            vacation_days=vacation_days,
+            admission_dates=admission_dates,
+            dismissal_dates=dismissal_dates,
+            competence_month=competence_month,
+            competence_year=competence_year
+        )
         
-        return results
+        # Calcular valores finais (em centavos inteiros): empresa 80%, profissional o restante
+        total_cents = days_worked.to_numpy(dtype=np.int64) * np.rint(daily_values.to_numpy() * 100).astype(np.int64)
+        company_cents = (total_cents * 4 + 2) // 5  # 80% arredondado ao centavo
+        discount_cents = total_cents - company_cents
+        
+        # Datas formatadas uma única vez por coluna
+        admission_texts = self._format_dates_for_output(admission_dates)
+        dismissal_texts = self._format_dates_for_output(dismissal_dates)
+        
+        observations = self._generate_observations(vacation_days, admission_texts, dismissal_texts)
+        
+        return pd.DataFrame({
+            'Matricula': base_df['MATRICULA'].to_numpy(),
+            'Admissão': admission_texts.to_numpy(),
+            # Categórico: resumo, validação e exportação operam sobre os códigos inteiros
+            'Sindicato do Colaborador': unions.astype('category').array.remove_unused_categories(),
+            'Competência': f'01/{competence_month:02d}/{competence_year}',
+            'Dias': days_worked.to_numpy(dtype=np.int32),  # no máximo algumas dezenas de dias
+            'VALOR DIÁRIO VR': daily_values.to_numpy(),
+            'TOTAL': total_cents / 100,
+            'Custo empresa': company_cents / 100,
+            'Desconto profissional': discount_cents / 100,
+            'OBS GERAL': observations.to_numpy()
+        })
     
-    def _format_date_for_output(self, date_val) -> str:
-        """Formata data para saída, tratando diferentes tipos de entrada."""
-        if date_val is None or pd.isna(date_val):
-            return ''
+    def _format_dates_for_output(self, dates: pd.Series) -> pd.Series:
+        """Formata uma coluna de datas como dd/mm/aaaa, tratando diferentes tipos de entrada."""
+        parsed = _as_datetime(dates)
+        formatted = parsed.dt.strftime('%d/%m/%Y')
         
-        try:
-            if hasattr(date_val, 'strftime'):
-                return date_val.strftime('%d/%m/%Y')
-            elif isinstance(date_val, str):
-                # Se já é string, tentar converter e formatar
-                dt = pd.to_datetime(date_val, dayfirst=True)
-                return dt.strftime('%d/%m/%Y')
-            else:
-                return str(date_val)
-        except:
-            return str(date_val) if date_val else ''
+        # Valores que não puderam ser convertidos são mantidos como texto
+        unparsed = parsed.isna() & dates.notna()
+        if unparsed.any():
+            formatted = formatted.where(~unparsed, dates.astype(str))
+        
+        return formatted.fillna('')
     
-    def _generate_observations(self, employee: pd.Series, vacation_days: int, 
-                             admission_date: Optional[datetime], dismissal_date: Optional[datetime]) -> str:
-        """Gera observações para o registro."""
-        observations = []
-        
-        if vacation_days > 0:
-            observations.append(f"Férias: {vacation_days} dias")
-        
-        if admission_date is not None and pd.notna(admission_date):
-            # Garantir que é datetime antes de usar strftime
-            if hasattr(admission_date, 'strftime'):
-                observations.append(f"Admissão: {admission_date.strftime('%d/%m/%Y')}")
-            else:
-                observations.append(f"Admissão: {str(admission_date)}")
+    def _generate_observations(self, vacation_days: pd.Series, admission_texts: pd.Series,
+                               dismissal_texts: pd.Series) -> pd.Series:
+        """Gera observações para todos os registros, separando as partes preenchidas por '; '."""
+        parts = [
+            ('Férias: ' + vacation_days.astype(str) + ' dias').where(vacation_days > 0, ''),
+            ('Admissão: ' + admission_texts).where(admission_texts != '', ''),
+            ('Demissão: ' + dismissal_texts).where(dismissal_texts != '', ''),
+        ]
         
-        if dismissal_date is not None and pd.notna(dismissal_date):
-            # Garantir que é datetime antes de usar strftime
-            if hasattr(dismissal_date, 'strftime'):
-                observations.append(f"Demissão: {dismissal_date.strftime('%d/%m/%Y')}")
-            else:
-                observations.append(f"Demissão: {str(dismissal_date)}")
+        observations = parts[0]
+        for part in parts[1:]:
+            separator = pd.Series('; ', index=part.index).where((observations != '') & (part != ''), '')
+            observations = observations + separator + part
         
-        return "; ".join(observations)
+        return observations
+    
+    @staticmethod
+    def _write_sheet(workbook: "xlsxwriter.Workbook", sheet_name: str, df: pd.DataFrame) -> None:
+        """Grava um DataFrame em ordem de linhas, exigida pelo modo constant_memory do xlsxwriter."""
+        worksheet = workbook.add_worksheet(sheet_name)
+        header_format = workbook.add_format({'bold': True, 'border': 1, 'align': 'center'})
+        worksheet.write_row(0, 0, [str(column) for column in df.columns], header_format)
+        
+        # Conversão em blocos: apenas SHEET_CHUNK_ROWS linhas ficam em objetos Python de cada vez;
+        # valores ausentes viram células vazias, como no to_excel do pandas
+        for start in range(0, len(df), SHEET_CHUNK_ROWS):
+            chunk = df.iloc[start:start + SHEET_CHUNK_ROWS]
+            rows = chunk.astype(object).where(chunk.notna(), None).itertuples(index=False, name=None)
+            for row_number, row in enumerate(rows, start=start + 1):
+                worksheet.write_row(row_number, 0, row)
     
-    def generate_final_report(self, output_file: str = 'VR_MENSAL_AUTOMATIZADO.xlsx') -> str:
+    def generate_final_report(self, output_file: Union[str, Path] = 'VR_MENSAL_AUTOMATIZADO.xlsx') -> Union[str, Path]:
         """Gera o arquivo final no formato esperado."""
         if self.final_result is None:
             raise ValueError("Execute create_consolidated_base() primeiro!")
         
-        self.logger.info(f"📄 Gerando arquivo final: {output_file}")
+        self.logger.info("📄 Gerando arquivo final: %s", output_file)
         
         # Garantir que o diretório existe
         output_path = Path(output_file)
@@ -800,10 +1097,19 @@ class VRAutomation:
         # Ordenar por matrícula para melhor organização
         self.final_result = self.final_result.sort_values('Matricula')
         
-        # Salvar arquivo Excel
+        # Saída em CSV quando solicitada pela extensão do arquivo
+        if output_path.suffix.lower() == '.csv':
+            self.final_result.to_csv(output_path, index=False, encoding='utf-8-sig')
+            self.logger.info("✅ Arquivo salvo com sucesso: %s", output_file)
+            return output_file
+        
+        # Salvar arquivo Excel, gravando linha a linha sem manter a planilha em memória
         try:
-            with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
-                self.final_result.to_excel(writer, sheet_name='VR_Consolidado', index=False)
+            # Import adiado: só carrega o writer quando o arquivo for de fato gerado
+            import xlsxwriter
+            
+            with xlsxwriter.Workbook(str(output_path), XLSXWRITER_OPTIONS) as workbook:
+                self._write_sheet(workbook, 'VR_Consolidado', self.final_result)
                 
                 # Adicionar planilha de estatísticas se disponível
                 if self.processing_stats:
@@ -830,22 +1136,22 @@ class VRAutomation:
                         'Valor': f'{self.processing_stats.processing_time:.2f}'
                     }])
                     
-                    stats_df.to_excel(writer, sheet_name='Estatísticas', index=False)
+                    self._write_sheet(workbook, 'Estatísticas', stats_df)
         
         except Exception as e:
-            self.logger.error(f"❌ Erro ao salvar arquivo: {e}")
+            self.logger.error("❌ Erro ao salvar arquivo: %s", e)
             raise
         
-        # Exibir estatísticas
-        if self.processing_stats:
+        # Exibir estatísticas (valores monetários formatados só se o nível INFO estiver ativo)
+        if self.processing_stats and self.logger.isEnabledFor(logging.INFO):
             self.logger.info("📊 Estatísticas do processamento:")
-            self.logger.info(f"   • Colaboradores: {self.processing_stats.total_collaborators}")
-            self.logger.info(f"   • Total de dias: {self.processing_stats.total_days}")
-            self.logger.info(f"   • Valor total: R$ {self.processing_stats.total_value:,.2f}")
-            self.logger.info(f"   • Custo empresa: R$ {self.processing_stats.company_cost:,.2f}")
-            self.logger.info(f"   • Desconto profissional: R$ {self.processing_stats.professional_discount:,.2f}")
+            self.logger.info("   • Colaboradores: %s", self.processing_stats.total_collaborators)
+            self.logger.info("   • Total de dias: %s", self.processing_stats.total_days)
+            self.logger.info("   • Valor total: R$ %s", format(self.processing_stats.total_value, ",.2f"))
+            self.logger.info("   • Custo empresa: R$ %s", format(self.processing_stats.company_cost, ",.2f"))
+            self.logger.info("   • Desconto profissional: R$ %s", format(self.processing_stats.professional_discount, ",.2f"))
         
-        self.logger.info(f"✅ Arquivo salvo com sucesso: {output_file}")
+        self.logger.info("✅ Arquivo salvo com sucesso: %s", output_file)
         return output_file
     
     def validate_data(self) -> bool:
@@ -856,26 +1162,28 @@ class VRAutomation:
         
         validations = self.validator.validate_processed_data(self.final_result)
         
-        # Agrupar resultados por nível
-        errors = [v for v in validations if v.level == ValidationLevel.ERROR]
-        warnings = [v for v in validations if v.level == ValidationLevel.WARNING]
-        info = [v for v in validations if v.level == ValidationLevel.INFO]
+        # Agrupar resultados por nível em uma única passada
+        buckets = {level: [] for level in ValidationLevel}
+        for validation in validations:
+            buckets[validation.level].append(validation)
+        errors = buckets[ValidationLevel.ERROR]
         
-        # Exibir resultados
-        self.logger.info("🔍 Resultados da validação:")
+        # Exibir resultados (erros, depois avisos, depois informações)
+        log_error, log_warning, log_info = self.logger.error, self.logger.warning, self.logger.info
+        log_info("🔍 Resultados da validação:")
         
         for validation in errors:
-            self.logger.error(f"   ❌ {validation.message}: {validation.count} casos")
+            log_error("   ❌ %s: %s casos", validation.message, validation.count)
             if validation.details:
-                self.logger.error(f"      Detalhes: {validation.details}")
+                log_error("      Detalhes: %s", validation.details)
         
-        for validation in warnings:
-            self.logger.warning(f"   ⚠️  {validation.message}: {validation.count} casos")
+        for validation in buckets[ValidationLevel.WARNING]:
+            log_warning("   ⚠️  %s: %s casos", validation.message, validation.count)
             if validation.details:
-                self.logger.warning(f"      Detalhes: {validation.details}")
+                log_warning("      Detalhes: %s", validation.details)
         
-        for validation in info:
-            self.logger.info(f"   ✅ {validation.message}")
+        for validation in buckets[ValidationLevel.INFO]:
+            log_info("   ✅ %s", validation.message)
         
         # Retornar True apenas se não houver erros
         validation_passed = len(errors) == 0
@@ -883,7 +1191,7 @@ class VRAutomation:
         if validation_passed:
             self.logger.info("✅ Todas as validações passaram com sucesso!")
         else:
-            self.logger.error(f"❌ Validação falhou: {len(errors)} erros encontrados")
+            self.logger.error("❌ Validação falhou: %s erros encontrados", len(errors))
         
         return validation_passed
     
@@ -893,27 +1201,53 @@ class VRAutomation:
             self.logger.warning("❌ Nenhum dado para gerar relatório")
             return None
         
+        # Resumo já calculado para este mesmo final_result
+        if self._summary_cache is not None and self._summary_cache[0] is self.final_result:
+            self.logger.debug("📈 Relatório resumido reaproveitado do cache")
+            return self._summary_cache[1]
+        
+        # Todos os colaboradores excluídos: nada a agregar
+        if len(self.final_result) == 0:
+            self.logger.info("📊 Sem dados após exclusões")
+            return pd.DataFrame(
+                columns=['Qtd_Funcionarios', 'Total_Dias', 'Valor_Total', 'Custo_Empresa',
+                         'Desconto_Funcionario', 'Valor_Medio_Diario', 'Valor_Medio_Por_Funcionario'],
+                index=pd.Index([], name='Sindicato do Colaborador')
+            )
+        
         self.logger.info("📈 Gerando relatório resumido por sindicato...")
         
         try:
-            summary = self.final_result.groupby('Sindicato do Colaborador').agg({
-                'Matricula': 'count',
-                'Dias': 'sum',
-                'TOTAL': 'sum',
-                'Custo empresa': 'sum',
-                'Desconto profissional': 'sum',
-                'VALOR DIÁRIO VR': 'mean'  # Valor médio por sindicato
-            }).round(2)
+            df = self.final_result
+            
+            # Agregação em uma passada: código do sindicato + bincount por coluna
+            codes, unions = pd.factorize(df['Sindicato do Colaborador'], sort=True)
+            grouped = codes >= 0  # sindicato ausente fica fora do resumo
+            if grouped.all():
+                grouped = slice(None)  # sem linhas a descartar: evita copiar cada coluna
+            codes = codes[grouped]
+            n_unions = len(unions)
+            
+            def group_sum(column: str, values: Optional[np.ndarray] = None) -> np.ndarray:
+                if values is None:
+                    values = df[column].to_numpy(dtype=float)
+                return np.bincount(codes, weights=values[grouped], minlength=n_unions)
             
-            # Renomear colunas para melhor legibilidade
-            summary.columns = [
-                'Qtd_Funcionarios', 
-                'Total_Dias', 
-                'Valor_Total', 
-                'Custo_Empresa', 
-                'Desconto_Funcionario',
-                'Valor_Medio_Diario'
-            ]
+            daily_values = df['VALOR DIÁRIO VR'].to_numpy(dtype=float)
+            daily_value_counts = group_sum('VALOR DIÁRIO VR', (~np.isnan(daily_values)).astype(float))
+            
+            summary = pd.DataFrame(
+                {
+                    'Qtd_Funcionarios': group_sum('Matricula', df['Matricula'].notna().to_numpy(dtype=float)).astype(np.int64),
+                    'Total_Dias': group_sum('Dias').round().astype(np.int64),
+                    'Valor_Total': group_sum('TOTAL'),
+                    'Custo_Empresa': group_sum('Custo empresa'),
+                    'Desconto_Funcionario': group_sum('Desconto profissional'),
+                    # Valor médio por sindicato
+                    'Valor_Medio_Diario': group_sum('VALOR DIÁRIO VR', np.nan_to_num(daily_values)) / daily_value_counts,
+                },
+                index=pd.Index(unions, name='Sindicato do Colaborador')
+            ).round(2)
             
             # Adicionar coluna de valor médio por funcionário
             summary['Valor_Medio_Por_Funcionario'] = (
@@ -923,101 +1257,139 @@ class VRAutomation:
             # Ordenar por valor total decrescente
             summary = summary.sort_values('Valor_Total', ascending=False)
             
-            # Exibir resumo no log
-            self.logger.info("📊 Resumo por sindicato (Top 10):")
-            
-            for sindicato, dados in summary.head(10).iterrows():
-                sindicato_short = sindicato[:40] + "..." if len(sindicato) > 40 else sindicato
-                self.logger.info(f"   📋 {sindicato_short}")
-                self.logger.info(f"      • Funcionários: {dados['Qtd_Funcionarios']}")
-                self.logger.info(f"      • Dias: {dados['Total_Dias']}")
-                self.logger.info(f"      • Valor Total: R$ {dados['Valor_Total']:,.2f}")
-                self.logger.info(f"      • Valor Médio/Func: R$ {dados['Valor_Medio_Por_Funcionario']:,.2f}")
-            
-            if len(summary) > 10:
-                self.logger.info(f"   ... e mais {len(summary) - 10} sindicatos")
-            
-            # Totais gerais
-            total_funcionarios = summary['Qtd_Funcionarios'].sum()
-            total_geral = summary['Valor_Total'].sum()
-            
-            self.logger.info("📈 Totais Gerais:")
-            self.logger.info(f"   • Total de Funcionários: {total_funcionarios}")
-            self.logger.info(f"   • Valor Total Geral: R$ {total_geral:,.2f}")
-            self.logger.info(f"   • Número de Sindicatos: {len(summary)}")
+            # Exibir resumo no log (formatação só ocorre se o nível INFO estiver ativo)
+            if self.logger.isEnabledFor(logging.INFO):
+                self._log_summary(summary)
             
+            self._summary_cache = (self.final_result, summary)
             return summary
             
         except Exception as e:
-            self.logger.error(f"❌ Erro ao gerar relatório resumido: {e}")
+            self.logger.error("❌ Erro ao gerar relatório resumido: %s", e)
             return None
     
-    def export_detailed_report(self, output_file: str) -> str:
+    def _log_summary(self, summary: pd.DataFrame) -> None:
+        """Registra no log o Top 10 de sindicatos e os totais gerais."""
+        self.logger.info("📊 Resumo por sindicato (Top 10):")
+        
+        top = summary.head(10)
+        short_names = [name[:40] + "..." if len(name) > 40 else name for name in top.index]
+        
+        rows = zip(
+            short_names,
+            top['Qtd_Funcionarios'].tolist(),
+            top['Total_Dias'].tolist(),
+            top['Valor_Total'].tolist(),
+            top['Valor_Medio_Por_Funcionario'].tolist()
+        )
+        for sindicato_short, employees, days, total_value, average_value in rows:
+            self.logger.info("   📋 %s", sindicato_short)
+            self.logger.info("      • Funcionários: %s", employees)
+            self.logger.info("      • Dias: %s", days)
+            self.logger.info("      • Valor Total: R$ %s", format(total_value, ",.2f"))
+            self.logger.info("      • Valor Médio/Func: R$ %s", format(average_value, ",.2f"))
+        
+        if len(summary) > 10:
+            self.logger.info("   ... e mais %s sindicatos", len(summary) - 10)
+        
+        # Totais gerais
+        total_funcionarios = summary['Qtd_Funcionarios'].sum()
+        total_geral = summary['Valor_Total'].sum()
+        
+        self.logger.info("📈 Totais Gerais:")
+        self.logger.info("   • Total de Funcionários: %s", total_funcionarios)
+        self.logger.info("   • Valor Total Geral: R$ %s", format(total_geral, ",.2f"))
+        self.logger.info("   • Número de Sindicatos: %s", len(summary))
+    
+    def export_detailed_report(self, output_file: Union[str, Path]) -> Union[str, Path]:
         """Exporta relatório detalhado com múltiplas abas."""
         if self.final_result is None:
             raise ValueError("Execute create_consolidated_base() primeiro!")
         
-        self.logger.info(f"📋 Exportando relatório detalhado: {output_file}")
+        self.logger.info("📋 Exportando relatório detalhado: %s", output_file)
         
         output_path = Path(output_file)
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
         try:
-            with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
-                # Aba 1: Dados consolidados
-                self.final_result.to_excel(
-                    writer, 
-                    sheet_name='Dados_Consolidados', 
-                    index=False
-                )
-                
-                # Aba 2: Resumo por sindicato
-                summary = self.generate_summary_report()
-                if summary is not None:
-                    summary.to_excel(writer, sheet_name='Resumo_Sindicatos')
-                
-                # Aba 3: Estatísticas detalhadas
-                if self.processing_stats:
-                    detailed_stats = pd.DataFrame([
-                        {'Categoria': 'Processamento', 'Métrica': 'Total de Colaboradores', 'Valor': self.processing_stats.total_collaborators},
-                        {'Categoria': 'Processamento', 'Métrica': 'Colaboradores Excluídos', 'Valor': self.processing_stats.excluded_count},
-                        {'Categoria': 'Processamento', 'Métrica': 'Tempo de Processamento (s)', 'Valor': self.processing_stats.processing_time},
-                        {'Categoria': 'Dias', 'Métrica': 'Total de Dias', 'Valor': self.processing_stats.total_days},
-                        {'Categoria': 'Dias', 'Métrica': 'Média de Dias por Funcionário', 'Valor': round(self.processing_stats.total_days / self.processing_stats.total_collaborators, 2)},
-                        {'Categoria': 'Valores', 'Métrica': 'Valor Total (R$)', 'Valor': self.processing_stats.total_value},
-                        {'Categoria': 'Valores', 'Métrica': 'Custo Empresa (R$)', 'Valor': self.processing_stats.company_cost},
-                        {'Categoria': 'Valores', 'Métrica': 'Desconto Profissional (R$)', 'Valor': self.processing_stats.professional_discount},
-                        {'Categoria': 'Valores', 'Métrica': 'Valor Médio por Funcionário (R$)', 'Valor': round(self.processing_stats.total_value / self.processing_stats.total_collaborators, 2)},
-                    ])
-                    detailed_stats.to_excel(writer, sheet_name='Estatísticas_Detalhadas', index=False)
+            # Fase 1: montar todas as abas antes de abrir o arquivo de saída
+            sheets: Dict[str, pd.DataFrame] = {}
+            
+            # Aba 1: Dados consolidados
+            sheets['Dados_Consolidados'] = self.final_result
+            
+            # Aba 2: Resumo por sindicato
+            summary = self.generate_summary_report()
+            if summary is not None and len(summary) > 0:
+                sheets['Resumo_Sindicatos'] = summary.reset_index()
+            
+            # Aba 3: Estatísticas detalhadas
+            if self.processing_stats:
+                stats = self.processing_stats
+                collaborators = stats.total_collaborators or 1  # evita divisão por zero sem colaboradores
+                sheets['Estatísticas_Detalhadas'] = pd.DataFrame({
+                    'Categoria': ['Processamento'] * 3 + ['Dias'] * 2 + ['Valores'] * 4,
+                    'Métrica': [
+                        'Total de Colaboradores',
+                        'Colaboradores Excluídos',
+                        'Tempo de Processamento (s)',
+                        'Total de Dias',
+                        'Média de Dias por Funcionário',
+                        'Valor Total (R$)',
+                        'Custo Empresa (R$)',
+                        'Desconto Profissional (R$)',
+                        'Valor Médio por Funcionário (R$)',
+                    ],
+                    'Valor': [
+                        stats.total_collaborators,
+                        stats.excluded_count,
+                        stats.processing_time,
+                        stats.total_days,
+                        round(stats.total_days / collaborators, 2),
+                        stats.total_value,
+                        stats.company_cost,
+                        stats.professional_discount,
+                        round(stats.total_value / collaborators, 2),
+                    ],
+                })
+            
+            # Aba 4: Detalhes de exclusões (se disponível)
+            if hasattr(self.exclusion_manager, 'exclusion_details'):
+                # Um DataFrame por categoria, com os textos como escalares
+                exclusion_frames = [
+                    pd.DataFrame({
+                        'Matricula': np.asarray(matriculas, dtype=object),
+                        'Categoria_Exclusao': category.title(),
+                        'Motivo': f'Excluído por ser {category}'
+                    })
+                    for category, matriculas in self.exclusion_manager.exclusion_details.items()
+                    if len(matriculas) > 0
+                ]
                 
-                # Aba 4: Detalhes de exclusões (se disponível)
-                if hasattr(self.exclusion_manager, 'exclusion_details'):
-                    exclusion_data = []
-                    for category, matriculas in self.exclusion_manager.exclusion_details.items():
-                        for matricula in matriculas:
-                            exclusion_data.append({
-                                'Matricula': matricula,
-                                'Categoria_Exclusao': category.title(),
-                                'Motivo': f'Excluído por ser {category}'
-                            })
-                    
-                    if exclusion_data:
-                        exclusion_df = pd.DataFrame(exclusion_data)
-                        exclusion_df.to_excel(writer, sheet_name='Detalhes_Exclusões', index=False)
+                if exclusion_frames:
+                    sheets['Detalhes_Exclusões'] = pd.concat(exclusion_frames, ignore_index=True)
+            
+            # Fase 2: o arquivo fica aberto apenas durante a gravação
+            # Import adiado: só carrega o writer quando o arquivo for de fato gerado
+            import xlsxwriter
+            
+            with xlsxwriter.Workbook(str(output_path), XLSXWRITER_OPTIONS) as workbook:
+                for sheet_name, sheet_df in sheets.items():
+                    self._write_sheet(workbook, sheet_name, sheet_df)
         
         except Exception as e:
-            self.logger.error(f"❌ Erro ao exportar relatório detalhado: {e}")
+            self.logger.error("❌ Erro ao exportar relatório detalhado: %s", e)
             raise
         
-        self.logger.info(f"✅ Relatório detalhado exportado: {output_file}")
+        self.logger.info("✅ Relatório detalhado exportado: %s", output_file)
         return output_file
     
     def run_complete_process(self, 
-                           files_folder: str, 
+                           files_folder: Union[str, Path], 
                            month: int = 5, 
                            year: int = 2025, 
-                           output_file: Optional[str] = None) -> str:
+                           output_file: Optional[Union[str, Path]] = None,
+                           include_summary_log: bool = True) -> Union[str, Path]:
         """
         Executa todo o processo de automação de forma integrada.
         
@@ -1026,6 +1398,9 @@ class VRAutomation:
             month: Mês de competência (1-12)
             year: Ano de competência
             output_file: Arquivo de saída (opcional)
+            include_summary_log: Gera e registra o resumo por sindicato ao final.
+                Quem for chamar export_detailed_report em seguida pode passar
+                False, já que a exportação gera o mesmo resumo.
         
         Returns:
             Caminho do arquivo gerado
@@ -1034,8 +1409,8 @@ class VRAutomation:
         
         self.logger.info("🚀 Iniciando Processo Completo de Automação VR")
         self.logger.info("=" * 60)
-        self.logger.info(f"📅 Competência: {month:02d}/{year}")
-        self.logger.info(f"📂 Pasta de dados: {files_folder}")
+        self.logger.info("📅 Competência: %02d/%s", month, year)
+        self.logger.info("📂 Pasta de dados: %s", files_folder)
         
         try:
             # Etapa 1: Carregamento de dados
@@ -1068,7 +1443,8 @@ class VRAutomation:
             final_file = self.generate_final_report(output_file)
             
             # Gerar relatório resumido
-            self.generate_summary_report()
+            if include_summary_log:
+                self.generate_summary_report()
             
             # Calcular tempo total
             total_time = (datetime.now() - start_time).total_seconds()
@@ -1077,12 +1453,12 @@ class VRAutomation:
             self.logger.info("=" * 60)
             self.logger.info("✅ PROCESSO CONCLUÍDO COM SUCESSO!")
             self.logger.info("=" * 60)
-            self.logger.info(f"⏱️  Tempo total: {total_time:.2f} segundos")
-            self.logger.info(f"📄 Arquivo gerado: {final_file}")
+            self.logger.info("⏱️  Tempo total: %.2f segundos", total_time)
+            self.logger.info("📄 Arquivo gerado: %s", final_file)
             
-            if self.processing_stats:
-                self.logger.info(f"👥 Colaboradores processados: {self.processing_stats.total_collaborators}")
-                self.logger.info(f"💰 Valor total: R$ {self.processing_stats.total_value:,.2f}")
+            if self.processing_stats and self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("👥 Colaboradores processados: %s", self.processing_stats.total_collaborators)
+                self.logger.info("💰 Valor total: R$ %s", format(self.processing_stats.total_value, ",.2f"))
             
             return final_file
             
@@ -1091,8 +1467,8 @@ class VRAutomation:
             self.logger.error("=" * 60)
             self.logger.error("❌ PROCESSO FALHOU!")
             self.logger.error("=" * 60)
-            self.logger.error(f"⏱️  Tempo até erro: {error_time:.2f} segundos")
-            self.logger.error(f"🚨 Erro: {str(e)}")
+            self.logger.error("⏱️  Tempo até erro: %.2f segundos", error_time)
+            self.logger.error("🚨 Erro: %s", e)
             raise
     
     def get_processing_summary(self) -> Dict[str, Any]:
@@ -1113,9 +1489,9 @@ class VRAutomation:
             },
             "data_quality": {
                 "total_records": len(self.final_result),
-                "unique_unions": self.final_result['Sindicato do Colaborador'].nunique(),
+                "unique_unions": self.processing_stats.unique_unions,
                 "date_range": {
-                    "competence": self.final_result['Competência'].iloc[0] if len(self.final_result) > 0 else None
+                    "competence": self.processing_stats.competence
                 }
             },
             "file_status": {
@@ -1129,10 +1505,10 @@ class VRAutomation:
 
 
 # Função de conveniência para uso direto
-def run_vr_automation(files_folder: str, 
+def run_vr_automation(files_folder: Union[str, Path], 
                      month: int = 5, 
                      year: int = 2025, 
-                     output_file: Optional[str] = None) -> str:
+                     output_file: Optional[Union[str, Path]] = None) -> Union[str, Path]:
     """
     Função de conveniência para executar a automação VR de forma simples.
     
@@ -1148,16 +1524,3 @@ def run_vr_automation(files_folder: str,
     automation = VRAutomation()
     return automation.run_complete_process(files_folder, month, year, output_file)
 
-
-if __name__ == "__main__":
-    # Exemplo de uso direto
-    try:
-        result_file = run_vr_automation(
-            files_folder="data",
-            month=5,
-            year=2025,
-            output_file="output/VR_MAIO_2025.xlsx"
-        )
-        print(f"✅ Processamento concluído: {result_file}")
-    except Exception as e:
-        print(f"❌ Erro no processamento: {e}")
\ No newline at end of file